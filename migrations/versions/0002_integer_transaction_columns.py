@@ -0,0 +1,144 @@
+"""Store transaction types as small integers and amounts as integer minor units
+
+- transactions.type: String(50) name -> SmallInteger ``TransactionType`` value
+- transactions.amount: Numeric(10, 2) -> transactions.amount_minor: BigInteger
+  count of the currency's minor units
+- adds the balance and history indexes
+- PostgreSQL only: users.created_at / last_active become timestamptz (the old
+  naive values were written in UTC)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# Frozen copies of TransactionType and MINOR_UNIT_PLACES as of this revision;
+# later changes to the application constants must not change what it does
+TYPE_CODES = {
+    "deposit": 1,
+    "withdraw": 2,
+    "withdrawal": 2,
+    "bonus": 3,
+    "win": 4,
+    "loss": 5,
+    "bet": 6,
+}
+TYPE_NAMES = {1: "deposit", 2: "withdraw", 3: "bonus", 4: "win", 5: "loss", 6: "bet"}
+MINOR_UNIT_PLACES = {"USD": 2, "BTC": 8, "ETH": 9, "USDT": 6, "BNB": 8, "USDC": 6}
+
+transactions = sa.table(
+    "transactions",
+    sa.column("type", sa.String),
+    sa.column("type_code", sa.SmallInteger),
+    sa.column("amount", sa.Numeric),
+    sa.column("amount_minor", sa.BigInteger),
+    sa.column("currency", sa.String)
+)
+
+def _scale(currency: sa.ColumnElement) -> sa.Case:
+    """Multiplier from major to minor units for each known currency."""
+    return sa.case(
+        {code: 10 ** places for code, places in MINOR_UNIT_PLACES.items()},
+        value=currency
+    )
+
+def _check_convertible() -> None:
+    """Fail before altering anything if a row has an unmapped type or currency."""
+    if context.is_offline_mode():
+        # No database to inspect when only rendering SQL (--sql)
+        return
+    bad = op.get_bind().execute(
+        sa.select(transactions.c.type, transactions.c.currency).distinct().where(
+            sa.or_(
+                transactions.c.type.not_in(list(TYPE_CODES)),
+                transactions.c.currency.not_in(list(MINOR_UNIT_PLACES))
+            )
+        )
+    ).all()
+    if bad:
+        raise RuntimeError(
+            f"Cannot convert transactions with (type, currency) in {sorted(map(tuple, bad))}"
+        )
+
+def upgrade() -> None:
+    _check_convertible()
+    
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column("type_code", sa.SmallInteger(), nullable=True))
+        batch.add_column(sa.Column("amount_minor", sa.BigInteger(), nullable=True))
+    
+    op.execute(
+        transactions.update().values(
+            type_code=sa.case(TYPE_CODES, value=transactions.c.type),
+            amount_minor=sa.cast(
+                sa.func.round(transactions.c.amount * _scale(transactions.c.currency)),
+                sa.BigInteger
+            )
+        )
+    )
+    
+    with op.batch_alter_table("transactions") as batch:
+        batch.drop_column("type")
+        batch.drop_column("amount")
+        batch.alter_column(
+            "type_code",
+            new_column_name="type",
+            existing_type=sa.SmallInteger(),
+            nullable=False
+        )
+        batch.alter_column("amount_minor", existing_type=sa.BigInteger(), nullable=False)
+    
+    op.create_index("ix_tx_user_currency_status", "transactions", ["user_id", "currency", "status"])
+    op.create_index("ix_tx_user_id", "transactions", ["user_id", "id"])
+    
+    if op.get_bind().dialect.name == "postgresql":
+        for column in ("created_at", "last_active"):
+            op.alter_column(
+                "users",
+                column,
+                type_=sa.DateTime(timezone=True),
+                existing_type=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+            )
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for column in ("created_at", "last_active"):
+            op.alter_column(
+                "users",
+                column,
+                type_=sa.DateTime(),
+                existing_type=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+            )
+    
+    op.drop_index("ix_tx_user_id", table_name="transactions")
+    op.drop_index("ix_tx_user_currency_status", table_name="transactions")
+    
+    # The new type column takes the old name, so convert through a temporary one
+    with op.batch_alter_table("transactions") as batch:
+        batch.alter_column("type", new_column_name="type_code", existing_type=sa.SmallInteger())
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column("type", sa.String(50), nullable=True))
+        batch.add_column(sa.Column("amount", sa.Numeric(precision=10, scale=2), nullable=True))
+    
+    # Amounts finer than a cent are rounded by the Numeric(10, 2) column
+    op.execute(
+        transactions.update().values(
+            type=sa.case(TYPE_NAMES, value=transactions.c.type_code),
+            amount=1.0 * transactions.c.amount_minor / _scale(transactions.c.currency)
+        )
+    )
+    
+    with op.batch_alter_table("transactions") as batch:
+        batch.drop_column("type_code")
+        batch.drop_column("amount_minor")
+        batch.alter_column("type", existing_type=sa.String(50), nullable=False)
+        batch.alter_column("amount", existing_type=sa.Numeric(precision=10, scale=2), nullable=False)
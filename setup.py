@@ -8,16 +8,21 @@ setup(
     author_email="your.email@example.com",
     packages=find_packages(),
     install_requires=[
-        "python-telegram-bot>=20.7",
+        "python-telegram-bot[rate-limiter]>=20.7",
         "SQLAlchemy>=2.0.25",
+        "cachetools>=5.3.2",
+        "aiosqlite>=0.19.0",
+        "asyncpg>=0.29.0",
         "python-dotenv>=1.0.0",
         "alembic>=1.13.1"
     ],
     extras_require={
         "dev": [
             "pytest>=7.4.4",
-            "pytest-asyncio>=0.23.3",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
             "black>=23.12.1",
             "isort>=5.13.2",
             "mypy>=1.8.0",
@@ -3,20 +3,23 @@ from functools import wraps
 import logging
 import os
 
-from telegram.ext import ApplicationBuilder, CommandHandler, CallbackQueryHandler
+from telegram.ext import (
+    AIORateLimiter, Application, ApplicationBuilder, CommandHandler, CallbackQueryHandler
+)
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from user_service import UserService
+# Load environment variables before the project modules below read them at
+# import time (user_service builds its engine from DATABASE_URL)
+load_dotenv()
+
+from user_service import UserService, SessionLocal, engine
 from wallet.wallet_service import WalletService
 from handlers.start_handler import StartHandler
 from handlers.wallet_handler import WalletHandler
 from handlers.help_handler import HelpHandler
 from init_db import init_db
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -57,16 +60,23 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             text="❌ An error occurred. Please try again later."
         )
 
+async def post_init(application: Application) -> None:
+    """Create database tables once the application's event loop is running."""
+    await init_db()
+
+async def post_shutdown(application: Application) -> None:
+    """Close pooled database connections so the process can exit cleanly."""
+    # aiosqlite runs each connection in a worker thread that would otherwise
+    # keep the interpreter alive after run_polling() returns
+    await engine.dispose()
+
 def main():
     """Initialize and run the bot."""
     try:
-        # Initialize database and create session factory
-        Session = init_db()
-        
-        # Initialize services
+        # Initialize services; tables are created in post_init
         global user_service, wallet_service
-        user_service = UserService(Session)
-        wallet_service = WalletService(Session)
+        user_service = UserService(SessionLocal)
+        wallet_service = WalletService(SessionLocal)
         
         # Initialize handlers
         start_handler = StartHandler(user_service, wallet_service)
@@ -74,7 +84,16 @@ def main():
         help_handler = HelpHandler()
         
         # Create application
-        app = ApplicationBuilder().token(os.getenv('TELEGRAM_TOKEN')).build()
+        app = (
+            ApplicationBuilder()
+            .token(os.getenv('TELEGRAM_TOKEN'))
+            .post_init(post_init)
+            .post_shutdown(post_shutdown)
+            # Queues Bot API calls within Telegram's flood limits (30 msg/s
+            # overall, 20 msg/min per group) and retries on RetryAfter
+            .rate_limiter(AIORateLimiter(max_retries=3))
+            .build()
+        )
         
         # Add handlers
         app.add_handler(CommandHandler('start', start_handler.handle))
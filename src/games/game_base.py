@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from decimal import Decimal
 import secrets
@@ -16,7 +16,7 @@ class GameResult:
     bet_amount: Decimal
     win_amount: Decimal
     outcome: str
-    timestamp: datetime = datetime.utcnow()
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     game_data: Optional[Dict[str, Any]] = None
 
 class Game(ABC):
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from typing import List, Dict, Any, Optional, Tuple, Set
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from ..game_base import Game, GameResult
 from .utils import (
     SlotSymbol, PaylinePattern, MultiplyBonus,
@@ -25,7 +25,7 @@ class JackpotTier:
         """Win the jackpot and reset it."""
         amount = self.current_amount
         self.current_amount = self.base_amount
-        self.last_won = datetime.utcnow()
+        self.last_won = datetime.now(timezone.utc)
         return amount
 
 class StickyWild:
@@ -219,7 +219,7 @@ class DragonsHoard(Game):
                 
                 win_amount = jackpot.win()
                 state['total_win'] += win_amount
-                state['last_jackpot_win'] = datetime.utcnow()
+                state['last_jackpot_win'] = datetime.now(timezone.utc)
                 
                 messages.append(
                     f"🎊 JACKPOT! Collected {required} {symbol} symbols!\n"
@@ -1,7 +1,8 @@
-from typing import Optional, Any, Dict, List
-from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
+from typing import Optional, Any, Dict, List, Callable, Awaitable
+from telegram import Bot, Message, Update, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
+import functools
 import logging
 
 from ..wallet import WalletService, CryptoType, CryptoAmount
@@ -10,6 +11,33 @@ from ..games import game_manager
 
 logger = logging.getLogger(__name__)
 
+# Generic reply sent when a handler fails unexpectedly
+_ERR_MSG = "❌ An error occurred. Please try again later."
+
+HandlerMethod = Callable[[Any, Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+
+def handle_errors(func: HandlerMethod) -> HandlerMethod:
+    """
+    Decorator for handler methods that logs unexpected errors and replies
+    with a generic error message instead of letting the exception escape.
+    """
+    @functools.wraps(func)
+    async def wrapper(
+        self: "BaseHandler",
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        try:
+            return await func(self, update, context)
+        except Exception:
+            logger.exception(
+                f"Error in {func.__qualname__}",
+                extra={"user_id": update.effective_user.id}
+            )
+            await self.send(context.bot, update.effective_chat.id, text=_ERR_MSG)
+    
+    return wrapper
+
 class BaseHandler:
     """Base class for all command handlers with common functionality."""
     
@@ -28,6 +56,23 @@ class BaseHandler:
         self.wallet_service = wallet_service
         self.user_service = user_service
     
+    async def send(self, bot: Bot, chat_id: int, **kwargs: Any) -> Message:
+        """
+        Send a message to a chat.
+        
+        Telegram's rate limits are enforced by the application's
+        ``AIORateLimiter`` (see ``bot.py``), which throttles every Bot API call.
+        
+        Args:
+            bot: Bot instance to send with
+            chat_id: Target chat ID
+            **kwargs: Extra arguments for ``Bot.send_message``
+            
+        Returns:
+            Message: The sent message
+        """
+        return await bot.send_message(chat_id=chat_id, **kwargs)
+    
     async def ensure_registered(
         self,
         update: Update,
@@ -130,8 +175,9 @@ class BaseHandler:
                     parse_mode=ParseMode.HTML
                 )
             else:
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
+                await self.send(
+                    context.bot,
+                    update.effective_chat.id,
                     text=error_text,
                     parse_mode=ParseMode.HTML
                 )
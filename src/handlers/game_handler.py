@@ -6,10 +6,7 @@ from telegram.constants import ParseMode
 import logging
 
 from .base_handler import BaseHandler
-from ..wallet import (
-    CryptoType, CryptoAmount, WalletError,
-    InsufficientFundsError, InvalidAmountError
-)
+from ..wallet import CryptoType, CryptoAmount
 from ..wallet.transaction import TransactionType, Transaction
 from ..games import game_manager, GameResult
 
@@ -198,7 +195,7 @@ class GameHandler(BaseHandler):
                 crypto_type
             )
             
-        except (ValueError, InvalidAmountError) as e:
+        except ValueError as e:
             await self.send_error(
                 update,
                 context,
@@ -6,10 +6,7 @@ from telegram.constants import ParseMode
 import logging
 
 from .base_handler import BaseHandler
-from ..wallet import (
-    CryptoType, CryptoAmount, WalletError,
-    InsufficientFundsError, InvalidAmountError
-)
+from ..wallet import CryptoType, CryptoAmount
 from ..wallet.transaction import TransactionType, Transaction
 from ..payments.service import PaymentService
 from ..payments.provider import PaymentStatus
@@ -3,20 +3,29 @@ from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
 import logging
 import re
-from decimal import Decimal
 from typing import Optional, List, Sequence, Callable
 from datetime import datetime
 
-from ..wallet.transaction import Transaction
+from ..wallet.crypto_types import parse_decimal
+from ..wallet.transaction import Transaction, TransactionType, CREDIT_TYPES
 from ..wallet.wallet_service import WalletService
 from ..user_service import UserService
-from .base_handler import BaseHandler
+from .base_handler import BaseHandler, handle_errors
 
 logger = logging.getLogger(__name__)
 
+def _fmt_dt(d: datetime) -> str:
+    """Format a timestamp as ``YYYY-MM-DD HH:MM`` without going through strftime."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
 class WalletHandler(BaseHandler):
     """Handler for wallet-related commands and callbacks."""
     
+    # Message templates for the balance view
+    _BALANCE_HEADER = "💰 Current balance: ${:.2f}\n"
+    _RECENT_HEADER = "Recent transactions:"
+    _TX_LINE = "{dt} {sign}${amt:.2f} ({type})"
+    
     def __init__(self, user_service: UserService, wallet_service: WalletService):
         """
         Initialize wallet handler.
@@ -29,11 +38,7 @@ class WalletHandler(BaseHandler):
         self.wallet_service = wallet_service
         logger.info("WalletHandler initialized")
     
-    @staticmethod
-    def _get_transaction_sort_key(tx: Transaction) -> datetime:
-        """Get the sort key for a transaction."""
-        return tx.created_at
-    
+    @handle_errors
     async def handle_deposit(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
         Handle deposit command.
@@ -42,68 +47,63 @@ class WalletHandler(BaseHandler):
             update: Telegram update
             context: Callback context
         """
-        try:
-            user_id = update.effective_user.id
-            
-            # Check if user is registered
-            if not await self.user_service.is_user_registered(user_id):
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Please use /start to register first."
-                )
-                return
-            
-            # Extract amount from command
-            if not context.args or not re.match(r'^\d+(\.\d{1,2})?$', context.args[0]):
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Please specify a valid amount: /deposit <amount>"
-                )
-                return
-            
-            amount = Decimal(context.args[0])
-            if amount <= 0:
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Amount must be greater than 0"
-                )
-                return
-            
-            # Create deposit transaction
-            if await self.wallet_service.create_transaction(
-                user_id=user_id,
-                type="deposit",
-                amount=amount,
-                currency="USD"
-            ):
-                # Get updated balance
-                balance = await self.wallet_service.get_user_balance(user_id, "USD")
-                
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text=(
-                        f"✅ Deposited: ${amount:.2f}\n"
-                        f"Current balance: ${balance:.2f}"
-                    ),
-                    parse_mode=ParseMode.HTML
-                )
-            else:
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Failed to process deposit. Please try again later."
-                )
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        # Check if user is registered
+        if not await self.user_service.is_user_registered(user_id):
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Please use /start to register first."
+            )
+            return
+        
+        # Extract amount from command
+        if not context.args or not re.match(r'^\d+(\.\d{1,2})?$', context.args[0]):
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Please specify a valid amount: /deposit <amount>"
+            )
+            return
+        
+        amount = parse_decimal(context.args[0])
+        if amount <= 0:
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Amount must be greater than 0"
+            )
+            return
         
-        except Exception as e:
-            logger.error(
-                f"Error in deposit handler: {str(e)}",
-                exc_info=True,
-                extra={"user_id": update.effective_user.id}
+        # Create deposit transaction
+        if await self.wallet_service.create_transaction(
+            user_id=user_id,
+            type=TransactionType.DEPOSIT,
+            amount=amount,
+            currency="USD"
+        ):
+            # Get updated balance
+            balance = await self.wallet_service.get_user_balance(user_id, "USD")
+            
+            await self.send(
+                context.bot,
+                chat_id,
+                text=(
+                    f"✅ Deposited: ${amount:.2f}\n"
+                    f"Current balance: ${balance:.2f}"
+                ),
+                parse_mode=ParseMode.HTML
             )
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="❌ An error occurred. Please try again later."
+        else:
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Failed to process deposit. Please try again later."
             )
     
+    @handle_errors
     async def handle_withdraw(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
         Handle withdraw command.
@@ -112,77 +112,73 @@ class WalletHandler(BaseHandler):
             update: Telegram update
             context: Callback context
         """
-        try:
-            user_id = update.effective_user.id
-            
-            # Check if user is registered
-            if not await self.user_service.is_user_registered(user_id):
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Please use /start to register first."
-                )
-                return
-            
-            # Extract amount from command
-            if not context.args or not re.match(r'^\d+(\.\d{1,2})?$', context.args[0]):
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Please specify a valid amount: /withdraw <amount>"
-                )
-                return
-            
-            amount = Decimal(context.args[0])
-            if amount <= 0:
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Amount must be greater than 0"
-                )
-                return
-            
-            # Check balance
-            balance = await self.wallet_service.get_user_balance(user_id, "USD")
-            if balance < amount:
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text=f"❌ Insufficient balance. Current balance: ${balance:.2f}"
-                )
-                return
-            
-            # Create withdrawal transaction
-            if await self.wallet_service.create_transaction(
-                user_id=user_id,
-                type="withdraw",
-                amount=amount,
-                currency="USD"
-            ):
-                # Get updated balance
-                new_balance = await self.wallet_service.get_user_balance(user_id, "USD")
-                
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text=(
-                        f"✅ Withdrawn: ${amount:.2f}\n"
-                        f"Current balance: ${new_balance:.2f}"
-                    ),
-                    parse_mode=ParseMode.HTML
-                )
-            else:
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Failed to process withdrawal. Please try again later."
-                )
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        # Check if user is registered
+        if not await self.user_service.is_user_registered(user_id):
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Please use /start to register first."
+            )
+            return
+        
+        # Extract amount from command
+        if not context.args or not re.match(r'^\d+(\.\d{1,2})?$', context.args[0]):
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Please specify a valid amount: /withdraw <amount>"
+            )
+            return
         
-        except Exception as e:
-            logger.error(
-                f"Error in withdraw handler: {str(e)}",
-                exc_info=True,
-                extra={"user_id": update.effective_user.id}
+        amount = parse_decimal(context.args[0])
+        if amount <= 0:
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Amount must be greater than 0"
             )
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="❌ An error occurred. Please try again later."
+            return
+        
+        # Check balance
+        balance = await self.wallet_service.get_user_balance(user_id, "USD")
+        if balance < amount:
+            await self.send(
+                context.bot,
+                chat_id,
+                text=f"❌ Insufficient balance. Current balance: ${balance:.2f}"
+            )
+            return
+        
+        # Create withdrawal transaction
+        if await self.wallet_service.create_transaction(
+            user_id=user_id,
+            type=TransactionType.WITHDRAWAL,
+            amount=amount,
+            currency="USD"
+        ):
+            # Get updated balance
+            new_balance = await self.wallet_service.get_user_balance(user_id, "USD")
+            
+            await self.send(
+                context.bot,
+                chat_id,
+                text=(
+                    f"✅ Withdrawn: ${amount:.2f}\n"
+                    f"Current balance: ${new_balance:.2f}"
+                ),
+                parse_mode=ParseMode.HTML
+            )
+        else:
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Failed to process withdrawal. Please try again later."
             )
     
+    @handle_errors
     async def handle_balance(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
         Handle balance command.
@@ -191,54 +187,47 @@ class WalletHandler(BaseHandler):
             update: Telegram update
             context: Callback context
         """
-        try:
-            user_id = update.effective_user.id
-            
-            # Check if user is registered
-            if not await self.user_service.is_user_registered(user_id):
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="❌ Please use /start to register first."
-                )
-                return
-            
-            # Get balance
-            balance = await self.wallet_service.get_user_balance(user_id, "USD")
-            
-            # Get recent transactions
-            transactions: List[Transaction] = await self.wallet_service.get_user_transactions(user_id)
-            recent_txs: List[Transaction] = sorted(
-                transactions,
-                key=self._get_transaction_sort_key,
-                reverse=True
-            )[:5]
-            
-            # Format message
-            msg = f"💰 Current balance: ${balance:.2f}\n\n"
-            
-            if recent_txs:
-                msg += "Recent transactions:\n"
-                for tx in recent_txs:
-                    symbol = "+" if tx.type in ["deposit", "win", "bonus"] else "-"
-                    msg += (
-                        f"{tx.created_at.strftime('%Y-%m-%d %H:%M')} "
-                        f"{symbol}${abs(tx.amount):.2f} "
-                        f"({tx.type})\n"
-                    )
-            
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text=msg,
-                parse_mode=ParseMode.HTML
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        # Check if user is registered
+        if not await self.user_service.is_user_registered(user_id):
+            await self.send(
+                context.bot,
+                chat_id,
+                text="❌ Please use /start to register first."
             )
+            return
+        
+        # Get balance
+        balance = await self.wallet_service.get_user_balance(user_id, "USD")
+        
+        # Get recent transactions (newest first)
+        recent_txs: List[Transaction] = await self.wallet_service.get_user_transactions(
+            user_id,
+            limit=5
+        )
+        
+        # Format message
+        lines = [self._BALANCE_HEADER.format(balance)]
         
-        except Exception as e:
-            logger.error(
-                f"Error in balance handler: {str(e)}",
-                exc_info=True,
-                extra={"user_id": update.effective_user.id}
+        if recent_txs:
+            lines.append(self._RECENT_HEADER)
+            lines.extend(
+                self._TX_LINE.format(
+                    dt=_fmt_dt(tx.created_at),
+                    sign="+" if tx.type in CREDIT_TYPES else "-",
+                    amt=abs(tx.amount),
+                    type=TransactionType(tx.type).name.lower()
+                )
+                for tx in recent_txs
             )
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="❌ An error occurred. Please try again later."
-            ) 
\ No newline at end of file
+        
+        msg = "\n".join(lines)
+        
+        await self.send(
+            context.bot,
+            chat_id,
+            text=msg,
+            parse_mode=ParseMode.HTML
+        )
\ No newline at end of file
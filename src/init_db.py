@@ -1,9 +1,7 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
 import logging
-import os
 
-from user_service import Base, User
+from user_service import Base, engine
 from wallet.transaction import Transaction
 
 # Configure logging
@@ -13,27 +11,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def init_db():
-    """Initialize the database with required tables."""
+async def init_db():
+    """
+    Initialize the database with required tables.
+
+    Reuses the process-wide engine from ``user_service`` so repeated calls
+    never build a second engine or connection pool.
+    """
     try:
-        # Get database URL from environment variable
-        database_url = os.getenv('DATABASE_URL', 'sqlite:///casino.db')
-        
-        # Create engine
-        engine = create_engine(database_url)
-        
-        # Create all tables
-        Base.metadata.create_all(engine)
-        
-        # Create session factory
-        Session = sessionmaker(bind=engine)
+        # Create all tables; DDL runs through the async engine's sync facade
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         
         logger.info("Database initialized successfully")
-        return Session
         
     except Exception as e:
         logger.error(f"Error initializing database: {str(e)}", exc_info=True)
         raise
 
+async def _main():
+    """Initialize the database, then close the pool so the script can exit."""
+    try:
+        await init_db()
+    finally:
+        # aiosqlite connections run in worker threads that keep the process alive
+        await engine.dispose()
+
 if __name__ == '__main__':
-    init_db() 
\ No newline at end of file
+    asyncio.run(_main())
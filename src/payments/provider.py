@@ -2,7 +2,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Callable
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
@@ -12,6 +13,7 @@ except ImportError:
     stripe = None
 
 from ..wallet import CryptoType, CryptoAmount
+from ..wallet.crypto_types import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +29,7 @@ class PaymentStatus(Enum):
     EXPIRED = "expired"
     REFUNDED = "refunded"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PaymentIntent:
     """Represents a payment intent with provider-specific details."""
     id: str
@@ -107,6 +109,13 @@ class PaymentProvider(ABC):
 class StripeProvider(PaymentProvider):
     """Stripe payment provider implementation."""
     
+    # Checkout session status -> payment status
+    _STATUS_MAP: Dict[str, PaymentStatus] = {
+        'open': PaymentStatus.PENDING,
+        'complete': PaymentStatus.COMPLETED,
+        'expired': PaymentStatus.EXPIRED
+    }
+    
     def _configure(self, **kwargs) -> None:
         """Configure Stripe-specific settings."""
         if stripe is None:
@@ -128,8 +137,9 @@ class StripeProvider(PaymentProvider):
             # Convert crypto amount to fiat (USD cents)
             amount_usd = self._convert_to_usd_cents(amount)
             
-            # Create Stripe session
-            session = await self.client.checkout.Session.create(
+            # Create Stripe session (the SDK call blocks, so run it in a worker thread)
+            session = await asyncio.to_thread(
+                self.client.checkout.Session.create,
                 payment_method_types=['card'],
                 line_items=[{
                     'price_data': {
@@ -169,17 +179,12 @@ class StripeProvider(PaymentProvider):
     ) -> PaymentStatus:
         """Check Stripe payment status."""
         try:
-            session = await self.client.checkout.Session.retrieve(
+            session = await asyncio.to_thread(
+                self.client.checkout.Session.retrieve,
                 payment_intent.provider_data['session_id']
             )
             
-            status_map = {
-                'open': PaymentStatus.PENDING,
-                'complete': PaymentStatus.COMPLETED,
-                'expired': PaymentStatus.EXPIRED
-            }
-            
-            return status_map.get(session.status, PaymentStatus.FAILED)
+            return self._STATUS_MAP.get(session.status, PaymentStatus.FAILED)
             
         except Exception as e:
             logger.error(f"Failed to check Stripe payment status: {str(e)}")
@@ -197,24 +202,46 @@ class StripeProvider(PaymentProvider):
                 self.webhook_secret
             )
             
-            if event.type == 'checkout.session.completed':
-                session = event.data.object
-                return PaymentIntent(
-                    id=session.id,
-                    amount=self._convert_from_usd_cents(session.amount_total),
-                    status=PaymentStatus.COMPLETED,
-                    provider_id='stripe',
-                    provider_data={'session_id': session.id},
-                    created_at=datetime.fromtimestamp(session.created),
-                    completed_at=datetime.now()
-                )
-            
-            return None
+            handler = self._EVENT_HANDLERS.get(event.type)
+            return handler(self, event) if handler else None
             
         except Exception as e:
             logger.error(f"Failed to process Stripe webhook: {str(e)}")
             return None
     
+    def _handle_session_completed(self, event: Any) -> PaymentIntent:
+        """Build the intent for a completed checkout session."""
+        session = event.data.object
+        return PaymentIntent(
+            id=session.id,
+            amount=self._convert_from_usd_cents(session.amount_total),
+            status=PaymentStatus.COMPLETED,
+            provider_id='stripe',
+            provider_data={'session_id': session.id},
+            created_at=datetime.fromtimestamp(session.created),
+            completed_at=datetime.now()
+        )
+    
+    def _handle_session_expired(self, event: Any) -> PaymentIntent:
+        """Build the intent for an expired checkout session."""
+        session = event.data.object
+        return PaymentIntent(
+            id=session.id,
+            amount=self._convert_from_usd_cents(session.amount_total),
+            status=PaymentStatus.EXPIRED,
+            provider_id='stripe',
+            provider_data={'session_id': session.id},
+            created_at=datetime.fromtimestamp(session.created),
+            expires_at=datetime.fromtimestamp(session.expires_at),
+            error_message="Checkout session expired"
+        )
+    
+    # Webhook event type -> handler
+    _EVENT_HANDLERS: Dict[str, Callable[["StripeProvider", Any], PaymentIntent]] = {
+        'checkout.session.completed': _handle_session_completed,
+        'checkout.session.expired': _handle_session_expired
+    }
+    
     def _convert_to_usd_cents(self, amount: CryptoAmount) -> int:
         """Convert crypto amount to USD cents."""
         # In a real implementation, this would use current exchange rates
@@ -10,6 +10,7 @@ from .provider import (
 )
 from ..wallet import CryptoAmount, CryptoType
 from ..wallet.transaction import Transaction, TransactionType
+from ..wallet.wallet_service import PENDING_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +124,7 @@ class PaymentService:
                     f"for user {transaction.user_id}"
                 )
                 
-            elif payment_intent.status == PaymentStatus.FAILED:
+            elif payment_intent.status in (PaymentStatus.FAILED, PaymentStatus.EXPIRED):
                 # Mark transaction as failed
                 await self.wallet_service.fail_transaction(
                     transaction,
@@ -137,10 +138,37 @@ class PaymentService:
         except Exception as e:
             logger.error(f"Error processing webhook: {str(e)}")
     
-    async def check_pending_payments(self) -> None:
-        """Check status of pending payments and update as needed."""
-        pending_transactions = await self.wallet_service.get_pending_transactions()
+    async def check_pending_payments(self, batch_size: int = PENDING_BATCH_SIZE) -> None:
+        """
+        Check status of pending payments and update as needed.
+        
+        Pending transactions are fetched and processed one page at a time,
+        so memory stays bounded and other handlers get to run between pages.
         
+        Args:
+            batch_size: Number of pending transactions to fetch per page
+        """
+        cursor = None
+        while True:
+            batch = await self.wallet_service.get_pending_transactions(
+                limit=batch_size,
+                cursor=cursor
+            )
+            if not batch:
+                break
+            
+            await self._process_pending_batch(batch)
+            if len(batch) < batch_size:
+                break
+            cursor = batch[-1].id
+    
+    async def _process_pending_batch(self, pending_transactions: List[Transaction]) -> None:
+        """
+        Check and settle one page of pending transactions.
+        
+        Args:
+            pending_transactions: Pending transactions to check
+        """
         for transaction in pending_transactions:
             provider_id = transaction.metadata.get('provider_id')
             payment_intent_id = transaction.metadata.get('payment_intent_id')
@@ -1,42 +1,91 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, select, create_engine
+from cachetools import TTLCache
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, select, update, exists, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.orm import relationship
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql import func
 import logging
-from datetime import datetime
-from typing import Optional, Final, Generator, Any
-from dataclasses import dataclass
-from contextlib import contextmanager
-import sys
-from pathlib import Path
+from datetime import datetime, timezone
+from typing import Optional, Final, AsyncGenerator, Any
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
+import os
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# asyncio drivers used when DATABASE_URL names only the backend
+ASYNC_DRIVERS: Final[dict] = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+def _with_async_driver(url: str) -> URL:
+    """
+    Pin a bare backend URL (e.g. ``postgresql://``) to its asyncio driver.
+
+    Args:
+        url: Database URL, with or without an explicit driver
+
+    Returns:
+        URL: The parsed URL, with the default asyncio driver filled in
+    """
+    parsed = make_url(url)
+    if "+" not in parsed.drivername and parsed.drivername in ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=f"{parsed.drivername}+{ASYNC_DRIVERS[parsed.drivername]}")
+    return parsed
+
 # Constants
-DATABASE_URL: Final[str] = "sqlite:///users.db"
-LOGGER_FORMAT: Final[str] = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+DATABASE_URL: Final[URL] = _with_async_driver(
+    os.getenv("DATABASE_URL", "sqlite+aiosqlite:///casino.db")
+)
+SQL_ECHO: Final[bool] = os.getenv("SQL_ECHO", "0") == "1"
 
-# Configure module logger
-logging.basicConfig(
-    format=LOGGER_FORMAT,
-    level=logging.INFO,
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(Path('logs/user_service.log'))
-    ]
+# In-process user caches: entry count and lifetime in seconds
+USER_CACHE_SIZE: Final[int] = 50_000
+USER_CACHE_TTL: Final[int] = 60
+# Minimum seconds between last_active writes for the same user
+LAST_ACTIVE_DEBOUNCE: Final[int] = 30
+IS_SQLITE: Final[bool] = DATABASE_URL.get_backend_name() == "sqlite"
+
+# Applied to every new SQLite connection: WAL lets readers run alongside a
+# writer, NORMAL drops the per-commit fsync (still safe under WAL)
+SQLITE_PRAGMAS: Final[tuple] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
 )
 
-# SQLAlchemy setup
-engine = create_engine(
+# SQLAlchemy setup: a single engine (and connection pool) shared process-wide
+engine = create_async_engine(
     DATABASE_URL,
-    echo=True,  # Log all SQL statements
-    future=True  # Use SQLAlchemy 2.0 style
+    echo=SQL_ECHO,  # Log all SQL statements (debugging only)
+    poolclass=AsyncAdaptedQueuePool,  # Pooled for every backend, including SQLite
+    pool_size=20,  # Connections kept warm in the pool
+    max_overflow=30,  # Extra connections allowed under burst load
+    pool_timeout=30,  # Seconds to wait for a free connection
+    pool_recycle=1800,  # Recycle connections every 30 minutes
+    pool_pre_ping=True,  # Detect stale connections before handing them out
+    pool_use_lifo=True  # Reuse the most recently returned connection first
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+if IS_SQLITE:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn: Any, _connection_record: Any) -> None:
+        """Tune each new SQLite connection for concurrent access."""
+        cursor = dbapi_conn.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+# Keep loaded attributes after commit; with AsyncSession an expired attribute
+# cannot lazily refresh and would raise instead
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 @dataclass
@@ -45,8 +94,8 @@ class UserData:
     telegram_id: int
     username: str
     is_active: bool = True
-    created_at: datetime = datetime.utcnow()
-    last_active: datetime = datetime.utcnow()
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_active: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class User(Base):
@@ -67,11 +116,13 @@ class User(Base):
     telegram_id: int = Column(Integer, unique=True, index=True, nullable=False)
     username: str = Column(String, index=True)
     is_active: bool = Column(Boolean, default=True)
-    created_at: datetime = Column(DateTime, default=datetime.utcnow)
-    last_active: datetime = Column(DateTime, default=datetime.utcnow)
+    # Both timestamps come from the application clock, the same one
+    # update_last_active writes with, so the column never mixes DB and app time
+    created_at: datetime = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    last_active: datetime = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     
-    # Relationships
-    transactions = relationship("Transaction", back_populates="user")
+    # Relationships: never lazy-loaded; use selectinload() where needed
+    transactions = relationship("Transaction", back_populates="user", lazy="raise_on_sql")
     
     def __repr__(self) -> str:
         """String representation of the user."""
@@ -93,14 +144,10 @@ class User(Base):
         }
 
 
-# Create the database tables
-Base.metadata.create_all(bind=engine)
-
-
 class UserService:
     """Service for managing user operations."""
     
-    def __init__(self, session_factory: sessionmaker = SessionLocal):
+    def __init__(self, session_factory: async_sessionmaker = SessionLocal):
         """
         Initialize the user service.
         
@@ -108,15 +155,23 @@ class UserService:
             session_factory: SQLAlchemy session factory
         """
         self.session_factory = session_factory
+        
+        # telegram_id -> UserData, filled by get_user
+        self._user_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+        # telegram_ids known to be registered (negative results are not cached)
+        self._registered_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+        # telegram_ids whose last_active was written within the debounce window
+        self._last_active_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=LAST_ACTIVE_DEBOUNCE)
+        
         logger.info("UserService initialized")
     
-    @contextmanager
-    def get_session(self) -> Generator[Session, None, None]:
+    @asynccontextmanager
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """
-        Context manager for database sessions.
+        Async context manager for database sessions.
         
         Yields:
-            Session: Database session
+            AsyncSession: Database session
         
         Raises:
             SQLAlchemyError: If there's a database error
@@ -126,10 +181,10 @@ class UserService:
             yield session
         except SQLAlchemyError as e:
             logger.error(f"Database error: {str(e)}", exc_info=True)
-            session.rollback()
+            await session.rollback()
             raise
         finally:
-            session.close()
+            await session.close()
     
     async def register_user(self, telegram_id: int, username: str) -> bool:
         """
@@ -145,12 +200,11 @@ class UserService:
         logger.info(f"Attempting to register user {telegram_id}")
         
         try:
-            with self.get_session() as session:
+            async with self.get_session() as session:
                 # Check if user already exists
-                stmt = select(User).where(User.telegram_id == telegram_id)
-                existing_user = session.execute(stmt).scalar_one_or_none()
+                stmt = select(exists().where(User.telegram_id == telegram_id))
                 
-                if existing_user:
+                if await session.scalar(stmt):
                     logger.info(
                         f"User with Telegram ID {telegram_id} already exists",
                         extra={"telegram_id": telegram_id}
@@ -160,7 +214,10 @@ class UserService:
                 # Create a new user
                 new_user = User(telegram_id=telegram_id, username=username)
                 session.add(new_user)
-                session.commit()
+                await session.commit()
+                
+                self._user_cache.pop(telegram_id, None)
+                self._registered_cache[telegram_id] = True
                 
                 logger.info(
                     f"User {username} registered successfully",
@@ -192,11 +249,16 @@ class UserService:
         Returns:
             bool: True if user is registered, False otherwise
         """
+        if telegram_id in self._registered_cache:
+            return True
+        
         try:
-            with self.get_session() as session:
-                stmt = select(User).where(User.telegram_id == telegram_id)
-                user = session.execute(stmt).scalar_one_or_none()
-                return user is not None
+            async with self.get_session() as session:
+                stmt = select(exists().where(User.telegram_id == telegram_id))
+                registered = bool(await session.scalar(stmt))
+                if registered:
+                    self._registered_cache[telegram_id] = True
+                return registered
         except SQLAlchemyError as e:
             logger.error(
                 f"Error checking user registration: {str(e)}",
@@ -205,30 +267,50 @@ class UserService:
             )
             return False
     
-    async def update_last_active(self, telegram_id: int) -> None:
+    async def update_last_active(self, telegram_id: int) -> bool:
         """
         Update the last active timestamp for a user.
 
+        Writes are debounced: a user updated less than
+        ``LAST_ACTIVE_DEBOUNCE`` seconds ago is skipped.
+
         Args:
             telegram_id: Unique Telegram ID of the user
+
+        Returns:
+            bool: True if the user was found and updated (or updated
+            recently enough to skip), False otherwise
         """
+        if telegram_id in self._last_active_cache:
+            return True
+        
         try:
-            with self.get_session() as session:
-                stmt = select(User).where(User.telegram_id == telegram_id)
-                user = session.execute(stmt).scalar_one_or_none()
-                if user:
-                    user.last_active = datetime.utcnow()
-                    session.commit()
+            async with self.get_session() as session:
+                # App time rather than func.now(): SQLite's CURRENT_TIMESTAMP has
+                # one-second resolution and drops the timezone
+                stmt = (
+                    update(User)
+                    .where(User.telegram_id == telegram_id)
+                    .values(last_active=datetime.now(timezone.utc))
+                )
+                result = await session.execute(stmt)
+                await session.commit()
+                
+                if result.rowcount:
+                    self._last_active_cache[telegram_id] = True
+                    self._user_cache.pop(telegram_id, None)
                     logger.debug(
                         f"Updated last active for user {telegram_id}",
                         extra={"telegram_id": telegram_id}
                     )
+                return bool(result.rowcount)
         except SQLAlchemyError as e:
             logger.error(
                 f"Error updating last active timestamp: {str(e)}",
                 exc_info=True,
                 extra={"telegram_id": telegram_id}
             )
+            return False
     
     async def get_user(self, telegram_id: int) -> Optional[UserData]:
         """
@@ -240,19 +322,27 @@ class UserService:
         Returns:
             Optional[UserData]: User data if found, None otherwise
         """
+        user = self._user_cache.get(telegram_id)
+        if user is not None:
+            return user
+        
         try:
-            with self.get_session() as session:
-                stmt = select(User).where(User.telegram_id == telegram_id)
-                user = session.execute(stmt).scalar_one_or_none()
+            async with self.get_session() as session:
+                # Select columns only so no ORM instance is built for a DTO
+                stmt = select(
+                    User.telegram_id,
+                    User.username,
+                    User.is_active,
+                    User.created_at,
+                    User.last_active
+                ).where(User.telegram_id == telegram_id)
+                row = (await session.execute(stmt)).one_or_none()
                 
-                if user:
-                    return UserData(
-                        telegram_id=user.telegram_id,
-                        username=user.username,
-                        is_active=user.is_active,
-                        created_at=user.created_at,
-                        last_active=user.last_active
-                    )
+                if row:
+                    user = UserData(**row._mapping)
+                    self._user_cache[telegram_id] = user
+                    self._registered_cache[telegram_id] = True
+                    return user
                 return None
         except SQLAlchemyError as e:
             logger.error(
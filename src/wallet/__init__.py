@@ -5,18 +5,9 @@ Handles user balances, transactions, and financial operations.
 
 from .transaction import (
     Transaction,
-    TransactionType,
-    TransactionStatus,
-    TransactionBatch
-)
-from .wallet_service import (
-    WalletService,
-    WalletError,
-    InsufficientFundsError,
-    TransactionError,
-    ConcurrencyError,
-    InvalidAmountError
+    TransactionType
 )
+from .wallet_service import WalletService
 from .crypto_types import (
     CryptoType,
     CryptoAmount
@@ -25,14 +16,7 @@ from .crypto_types import (
 __all__ = [
     'Transaction',
     'TransactionType',
-    'TransactionStatus',
-    'TransactionBatch',
     'WalletService',
-    'WalletError',
-    'InsufficientFundsError',
-    'TransactionError',
-    'ConcurrencyError',
-    'InvalidAmountError',
     'CryptoType',
     'CryptoAmount'
 ] 
\ No newline at end of file
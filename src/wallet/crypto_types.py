@@ -1,8 +1,10 @@
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache, total_ordering
 from typing import Dict, Optional
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+import sys
 
 class CryptoType(Enum):
     """Supported cryptocurrency types."""
@@ -12,9 +14,93 @@ class CryptoType(Enum):
     BNB = "Binance Coin"
     USDC = "USD Coin"
 
-@dataclass
+# dataclass(slots=True) is only available from Python 3.10
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Display precision for each cryptocurrency
+_DECIMAL_PLACES: Dict[CryptoType, int] = {
+    CryptoType.BTC: 8,   # Bitcoin uses 8 decimal places (satoshis)
+    CryptoType.ETH: 18,  # Ethereum uses 18 decimal places (wei)
+    CryptoType.USDT: 6,  # USDT typically uses 6 decimal places
+    CryptoType.BNB: 8,   # BNB uses 8 decimal places
+    CryptoType.USDC: 6   # USDC uses 6 decimal places
+}
+
+_ZERO = Decimal(0)
+
+# Stored precision per currency code: amounts are persisted as integer
+# multiples of 10**-places. ETH is kept in gwei (9 places) rather than wei,
+# since 18 places would overflow a signed 64-bit column above ~9.2 ETH.
+MINOR_UNIT_PLACES: Dict[str, int] = {
+    "USD": 2,
+    CryptoType.BTC.name: 8,
+    CryptoType.ETH.name: 9,
+    CryptoType.USDT.name: 6,
+    CryptoType.BNB.name: 8,
+    CryptoType.USDC.name: 6
+}
+
+def to_minor_units(amount: Decimal, currency: str) -> int:
+    """
+    Convert an amount to an integer count of the currency's minor units.
+
+    Args:
+        amount: Amount in major units (e.g. dollars, BTC)
+        currency: Currency code (a key of ``MINOR_UNIT_PLACES``)
+
+    Returns:
+        int: Amount in minor units (e.g. cents, satoshis)
+
+    Raises:
+        ValueError: If the currency is unknown or the amount is more precise
+            than its minor unit
+    """
+    if currency not in MINOR_UNIT_PLACES:
+        raise ValueError(f"Unsupported currency: {currency}")
+    scaled = Decimal(amount).scaleb(MINOR_UNIT_PLACES[currency])
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"{amount} is more precise than {currency} allows")
+    return int(scaled)
+
+def from_minor_units(units: int, currency: str) -> Decimal:
+    """
+    Convert an integer count of minor units back to a Decimal amount.
+
+    Args:
+        units: Amount in minor units
+        currency: Currency code (a key of ``MINOR_UNIT_PLACES``)
+
+    Returns:
+        Decimal: Amount in major units
+
+    Raises:
+        ValueError: If the currency is unknown
+    """
+    if currency not in MINOR_UNIT_PLACES:
+        raise ValueError(f"Unsupported currency: {currency}")
+    if not units:
+        return _ZERO
+    return Decimal(units).scaleb(-MINOR_UNIT_PLACES[currency])
+
+@lru_cache(maxsize=1024)
+def parse_decimal(amount_str: str) -> Decimal:
+    """
+    Parse a decimal string; repeated amounts are served from cache.
+
+    Decimal is immutable, so the cached instances are safe to share.
+
+    Args:
+        amount_str: Decimal string, e.g. ``"10.00"``
+
+    Returns:
+        Decimal: The parsed amount
+    """
+    return Decimal(amount_str)
+
+@total_ordering
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CryptoAmount:
-    """Represents an amount in a specific cryptocurrency."""
+    """Represents an amount in a specific cryptocurrency (immutable)."""
     
     amount: Decimal
     currency: CryptoType
@@ -22,18 +108,11 @@ class CryptoAmount:
     @classmethod
     def from_string(cls, amount_str: str, currency: CryptoType) -> 'CryptoAmount':
         """Create CryptoAmount from string representation."""
-        return cls(Decimal(amount_str), currency)
+        return cls(parse_decimal(amount_str), currency)
     
     def __str__(self) -> str:
         """String representation with appropriate decimal places."""
-        decimal_places = {
-            CryptoType.BTC: 8,   # Bitcoin uses 8 decimal places (satoshis)
-            CryptoType.ETH: 18,  # Ethereum uses 18 decimal places (wei)
-            CryptoType.USDT: 6,  # USDT typically uses 6 decimal places
-            CryptoType.BNB: 8,   # BNB uses 8 decimal places
-            CryptoType.USDC: 6   # USDC uses 6 decimal places
-        }
-        places = decimal_places[self.currency]
+        places = _DECIMAL_PLACES[self.currency]
         return f"{self.amount:.{places}f}"
     
     def __add__(self, other: 'CryptoAmount') -> 'CryptoAmount':
@@ -56,26 +135,11 @@ class CryptoAmount:
         """Multiply crypto amount by a factor."""
         return CryptoAmount(self.amount * factor, self.currency)
     
-    def __gt__(self, other: 'CryptoAmount') -> bool:
-        """Compare if this amount is greater than another."""
-        self._validate_comparison(other)
-        return self.amount > other.amount
-    
     def __lt__(self, other: 'CryptoAmount') -> bool:
         """Compare if this amount is less than another."""
         self._validate_comparison(other)
         return self.amount < other.amount
     
-    def __ge__(self, other: 'CryptoAmount') -> bool:
-        """Compare if this amount is greater than or equal to another."""
-        self._validate_comparison(other)
-        return self.amount >= other.amount
-    
-    def __le__(self, other: 'CryptoAmount') -> bool:
-        """Compare if this amount is less than or equal to another."""
-        self._validate_comparison(other)
-        return self.amount <= other.amount
-    
     def _validate_comparison(self, other: 'CryptoAmount') -> None:
         """Validate that two amounts can be compared."""
         if not isinstance(other, CryptoAmount):
@@ -83,7 +147,7 @@ class CryptoAmount:
         if self.currency != other.currency:
             raise ValueError("Cannot compare different cryptocurrencies")
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CryptoBalance:
     """Represents a user's balance in multiple cryptocurrencies."""
     
@@ -94,24 +158,18 @@ class CryptoBalance:
     def create_empty(cls) -> 'CryptoBalance':
         """Create a new empty balance for all supported cryptocurrencies."""
         return cls(
-            balances={
-                crypto: CryptoAmount(Decimal("0"), crypto)
-                for crypto in CryptoType
-            },
-            last_updated=datetime.utcnow()
+            balances=dict(_ZERO_AMOUNTS),
+            last_updated=datetime.now(timezone.utc)
         )
     
     def get_balance(self, currency: CryptoType) -> CryptoAmount:
         """Get balance for a specific cryptocurrency."""
-        return self.balances.get(
-            currency,
-            CryptoAmount(Decimal("0"), currency)
-        )
+        return self.balances.get(currency, _ZERO_AMOUNTS[currency])
     
     def update_balance(self, amount: CryptoAmount) -> None:
         """Update balance for a specific cryptocurrency."""
         self.balances[amount.currency] = amount
-        self.last_updated = datetime.utcnow()
+        self.last_updated = datetime.now(timezone.utc)
     
     def to_dict(self) -> Dict[str, str]:
         """Convert balances to dictionary for storage."""
@@ -127,7 +185,13 @@ class CryptoBalance:
             CryptoType[currency]: CryptoAmount.from_string(amount, CryptoType[currency])
             for currency, amount in data.items()
         }
-        return cls(balances, datetime.utcnow())
+        return cls(balances, datetime.now(timezone.utc))
+
+# Shared zero amount for each cryptocurrency
+_ZERO_AMOUNTS: Dict[CryptoType, CryptoAmount] = {
+    crypto: CryptoAmount(_ZERO, crypto)
+    for crypto in CryptoType
+}
 
 # Minimum transaction amounts for each cryptocurrency
 MIN_TRANSACTION_AMOUNTS = {
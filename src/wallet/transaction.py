@@ -1,51 +1,55 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from decimal import Decimal
+from enum import IntEnum
 
 from ..user_service import Base
+from .crypto_types import from_minor_units
+
+class TransactionType(IntEnum):
+    """Transaction types, stored as small integers in the database."""
+    DEPOSIT = 1
+    WITHDRAWAL = 2
+    BONUS = 3
+    WIN = 4
+    LOSS = 5
+    BET = 6
+
+# Transaction types that add to the balance; every other type subtracts
+CREDIT_TYPES = frozenset({
+    TransactionType.DEPOSIT,
+    TransactionType.WIN,
+    TransactionType.BONUS
+})
 
 class Transaction(Base):
     """Model representing a transaction in the system."""
     
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Covers the balance aggregate's filter
+        Index("ix_tx_user_currency_status", "user_id", "currency", "status"),
+        # Serves per-user history, keyset-paged newest first by id
+        Index("ix_tx_user_id", "user_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    type = Column(String(50), nullable=False)  # deposit, withdraw, win, loss, bonus
-    amount = Column(Numeric(precision=10, scale=2), nullable=False)
+    type = Column(SmallInteger, nullable=False)  # TransactionType value
+    amount_minor = Column(BigInteger, nullable=False)  # In the currency's minor units
     currency = Column(String(10), nullable=False)
     status = Column(String(20), nullable=False, default="pending")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="transactions")
+    user = relationship("User", back_populates="transactions", lazy="raise_on_sql")
     
-    def __init__(
-        self,
-        user_id: int,
-        type: str,
-        amount: Decimal,
-        currency: str,
-        status: str = "pending"
-    ):
-        """
-        Initialize a new transaction.
-        
-        Args:
-            user_id: User ID
-            type: Transaction type
-            amount: Transaction amount
-            currency: Currency type
-            status: Transaction status
-        """
-        self.user_id = user_id
-        self.type = type
-        self.amount = amount
-        self.currency = currency
-        self.status = status
+    @property
+    def amount(self) -> Decimal:
+        """Transaction amount in major units of its currency."""
+        return from_minor_units(self.amount_minor, self.currency)
     
     def __repr__(self) -> str:
         """String representation of the transaction."""
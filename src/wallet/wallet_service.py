@@ -1,32 +1,67 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker, Session
+from cachetools import TTLCache
+from sqlalchemy import select, insert, update, case, func
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 import logging
-from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from decimal import Decimal
 
-from .transaction import Transaction
+from .transaction import Transaction, TransactionType, CREDIT_TYPES
+from .crypto_types import to_minor_units, from_minor_units
 from ..user_service import Base
 
 logger = logging.getLogger(__name__)
 
+# Default page size when scanning pending transactions
+PENDING_BATCH_SIZE = 500
+# Default page size for a user's transaction history
+HISTORY_PAGE_SIZE = 100
+# Rows fetched per round-trip when streaming a full history
+STREAM_BATCH_SIZE = 1000
+# Balance cache: entry count and lifetime in seconds. The TTL bounds how
+# stale a balance can get when another process writes transactions.
+BALANCE_CACHE_SIZE = 50_000
+BALANCE_CACHE_TTL = 60
+
+def _to_insert_params(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a transaction row with a Decimal ``amount`` onto the stored columns."""
+    params = dict(row)
+    params["amount_minor"] = to_minor_units(params.pop("amount"), params["currency"])
+    return params
+
 class WalletService:
     """Service for managing user wallets and transactions."""
     
-    def __init__(self, session_factory: sessionmaker):
+    def __init__(self, session_factory: async_sessionmaker):
         """
         Initialize wallet service.
         
         Args:
-            session_factory: SQLAlchemy session factory
+            session_factory: SQLAlchemy async session factory
         """
         self.session_factory = session_factory
+        
+        # (user_id, currency) -> balance; dropped whenever that pair is written
+        self._balance_cache: TTLCache = TTLCache(maxsize=BALANCE_CACHE_SIZE, ttl=BALANCE_CACHE_TTL)
+        # Bumped on every invalidation so a read that raced a write is not cached
+        self._balance_writes = 0
+        
         logger.info("WalletService initialized")
     
-    async def create_transaction(self, user_id: int, type: str, amount: Decimal, currency: str) -> bool:
+    def _invalidate_balance(self, user_id: int, currency: str) -> None:
+        """Drop the cached balance for a user and currency."""
+        self._balance_writes += 1
+        self._balance_cache.pop((user_id, currency), None)
+    
+    async def create_transaction(
+        self,
+        user_id: int,
+        type: TransactionType,
+        amount: Decimal,
+        currency: str
+    ) -> bool:
         """
         Create a new transaction.
         
@@ -39,57 +74,97 @@ class WalletService:
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            transaction = Transaction(
-                user_id=user_id,
-                type=type,
-                amount=amount,
-                currency=currency
-            )
+        ids = await self.create_transactions_bulk([{
+            "user_id": user_id,
+            "type": type,
+            "amount": amount,
+            "currency": currency
+        }])
+        if not ids:
+            return False
+        
+        logger.info(
+            "Transaction created successfully",
+            extra={
+                "user_id": user_id,
+                "type": type,
+                "amount": str(amount),
+                "currency": currency
+            }
+        )
+        return True
+    
+    async def create_transactions_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create several transactions with a single INSERT ... RETURNING.
+        
+        Args:
+            rows: Column values for each transaction (user_id, type, amount,
+                currency and optionally status)
             
-            with self.session_factory() as session:
-                session.add(transaction)
-                session.commit()
+        Returns:
+            List[int]: IDs of the new transactions in the order of ``rows``,
+            or an empty list if the insert failed
+        """
+        if not rows:
+            return []
+        
+        try:
+            params = [_to_insert_params(row) for row in rows]
+            async with self.session_factory() as session:
+                stmt = insert(Transaction).returning(
+                    Transaction.id,
+                    sort_by_parameter_order=True
+                )
+                ids = list((await session.scalars(stmt, params)).all())
+                await session.commit()
                 
-                logger.info(
-                    "Transaction created successfully",
-                    extra={
-                        "user_id": user_id,
-                        "type": type,
-                        "amount": str(amount),
-                        "currency": currency
-                    }
+                for user_id, currency in {(p["user_id"], p["currency"]) for p in params}:
+                    self._invalidate_balance(user_id, currency)
+                
+                logger.debug(
+                    f"Created {len(ids)} transactions",
+                    extra={"count": len(ids)}
                 )
-                return True
+                return ids
                 
-        except SQLAlchemyError as e:
+        except (SQLAlchemyError, ValueError) as e:
             logger.error(
-                f"Error creating transaction: {str(e)}",
+                f"Error creating transactions: {str(e)}",
                 exc_info=True,
-                extra={
-                    "user_id": user_id,
-                    "type": type,
-                    "amount": str(amount),
-                    "currency": currency
-                }
+                extra={"count": len(rows)}
             )
-            return False
+            return []
     
-    async def get_user_transactions(self, user_id: int) -> List[Transaction]:
+    async def get_user_transactions(
+        self,
+        user_id: int,
+        *,
+        limit: int = HISTORY_PAGE_SIZE,
+        before_id: Optional[int] = None
+    ) -> List[Transaction]:
         """
-        Get all transactions for a user.
+        Get one page of a user's transactions, newest first.
+        
+        Pages are keyed on the transaction ID, so pass the ID of the last
+        transaction of the previous page as ``before_id`` to get the next one.
         
         Args:
             user_id: User ID
+            limit: Maximum number of transactions to return
+            before_id: Only return transactions with an ID less than this
             
         Returns:
-            List[Transaction]: List of transactions
+            List[Transaction]: Transactions, ordered by ID descending
         """
         try:
-            with self.session_factory() as session:
+            async with self.session_factory() as session:
                 stmt = select(Transaction).where(Transaction.user_id == user_id)
-                result = session.execute(stmt)
-                return list(result.scalars().all())
+                if before_id is not None:
+                    stmt = stmt.where(Transaction.id < before_id)
+                stmt = stmt.order_by(Transaction.id.desc()).limit(limit)
+                result = await session.scalars(stmt)
+                return list(result.all())
                 
         except SQLAlchemyError as e:
             logger.error(
@@ -99,6 +174,65 @@ class WalletService:
             )
             return []
     
+    async def stream_user_transactions(self, user_id: int) -> AsyncIterator[Transaction]:
+        """
+        Stream every transaction for a user, oldest first.
+        
+        Rows are fetched in batches of ``STREAM_BATCH_SIZE`` so memory use
+        stays bounded for long histories (e.g. exports). Database errors
+        propagate to the caller, since a partial stream cannot be retried
+        transparently.
+        
+        Args:
+            user_id: User ID
+            
+        Yields:
+            Transaction: The user's transactions, ordered by ID
+        """
+        async with self.session_factory() as session:
+            stmt = (
+                select(Transaction)
+                .where(Transaction.user_id == user_id)
+                .order_by(Transaction.id)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for transaction in await session.stream_scalars(stmt):
+                yield transaction
+    
+    async def get_pending_transactions(
+        self,
+        limit: int = PENDING_BATCH_SIZE,
+        cursor: Optional[int] = None
+    ) -> List[Transaction]:
+        """
+        Get one page of pending transactions, oldest first.
+        
+        Pages are keyed on the transaction ID, so pass the ID of the last
+        transaction of the previous page as ``cursor`` to get the next one.
+        
+        Args:
+            limit: Maximum number of transactions to return
+            cursor: Only return transactions with an ID greater than this
+            
+        Returns:
+            List[Transaction]: Pending transactions, ordered by ID
+        """
+        try:
+            async with self.session_factory() as session:
+                stmt = select(Transaction).where(Transaction.status == "pending")
+                if cursor is not None:
+                    stmt = stmt.where(Transaction.id > cursor)
+                stmt = stmt.order_by(Transaction.id).limit(limit)
+                return list((await session.scalars(stmt)).all())
+                
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Error getting pending transactions: {str(e)}",
+                exc_info=True,
+                extra={"cursor": cursor}
+            )
+            return []
+    
     async def get_user_balance(self, user_id: int, currency: str) -> Decimal:
         """
         Calculate user's balance for a specific currency.
@@ -110,27 +244,30 @@ class WalletService:
         Returns:
             Decimal: Current balance
         """
+        key: Tuple[int, str] = (user_id, currency)
+        cached = self._balance_cache.get(key)
+        if cached is not None:
+            return cached
+        writes = self._balance_writes
+        
         try:
-            with self.session_factory() as session:
-                # Get all completed transactions for the user and currency
-                stmt = select(Transaction).where(
+            async with self.session_factory() as session:
+                # Sum completed transactions in SQL: credits add, everything else subtracts
+                signed_amount = case(
+                    (Transaction.type.in_(CREDIT_TYPES), Transaction.amount_minor),
+                    else_=-Transaction.amount_minor
+                )
+                stmt = select(func.coalesce(func.sum(signed_amount), 0)).where(
                     Transaction.user_id == user_id,
                     Transaction.currency == currency,
                     Transaction.status == "completed"
                 )
-                transactions = session.execute(stmt).scalars().all()
-                
-                # Calculate balance
-                balance = Decimal("0")
-                for tx in transactions:
-                    if tx.type in ["deposit", "win", "bonus"]:
-                        balance += tx.amount
-                    else:
-                        balance -= tx.amount
-                
+                balance = from_minor_units(await session.scalar(stmt), currency)
+                if writes == self._balance_writes:
+                    self._balance_cache[key] = balance
                 return balance
                 
-        except SQLAlchemyError as e:
+        except (SQLAlchemyError, ValueError) as e:
             logger.error(
                 f"Error calculating user balance: {str(e)}",
                 exc_info=True,
@@ -139,7 +276,7 @@ class WalletService:
                     "currency": currency
                 }
             )
-            return Decimal("0")
+            return Decimal(0)
     
     async def update_transaction_status(self, transaction_id: int, status: str) -> bool:
         """
@@ -153,15 +290,18 @@ class WalletService:
             bool: True if successful, False otherwise
         """
         try:
-            with self.session_factory() as session:
-                stmt = select(Transaction).where(Transaction.id == transaction_id)
-                transaction = session.execute(stmt).scalar_one_or_none()
+            async with self.session_factory() as session:
+                stmt = (
+                    update(Transaction)
+                    .where(Transaction.id == transaction_id)
+                    .values(status=status, updated_at=func.now())
+                    .returning(Transaction.user_id, Transaction.currency)
+                )
+                row = (await session.execute(stmt)).one_or_none()
+                await session.commit()
                 
-                if transaction:
-                    transaction.status = status
-                    transaction.updated_at = datetime.utcnow()
-                    session.commit()
-                    
+                if row:
+                    self._invalidate_balance(row.user_id, row.currency)
                     logger.info(
                         f"Transaction {transaction_id} status updated to {status}",
                         extra={
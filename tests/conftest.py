@@ -1,4 +1,5 @@
 """Pytest configuration and shared fixtures."""
+import hashlib
 import os
 import pytest
 import pytest_asyncio
@@ -6,15 +7,30 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from typing import Dict, Any
 import asyncio
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from src.wallet import CryptoType, CryptoAmount
+from src.wallet.crypto_types import to_minor_units
 from src.wallet.wallet_service import WalletService
 from src.wallet.transaction import Transaction, TransactionType
 from src.games.game_manager import GameManager
 from src.payments.service import PaymentService
-from src.user_service import UserService, Base
+from src.user_service import UserService, User, Base
+
+# Decimal is immutable, so the amounts used across fixtures are parsed once
+D10 = Decimal('10.00')
+D20 = Decimal('20.00')
+D50 = Decimal('50.00')
+D100 = Decimal('100.00')
 
 @pytest.fixture
 def mock_user_data() -> Dict[str, Any]:
@@ -40,30 +56,91 @@ def mock_wallet_data() -> Dict[str, Any]:
         }
     }
 
-@pytest_asyncio.fixture
-async def mock_wallet_service():
-    """Create a mock wallet service."""
-    mock = AsyncMock()
-    mock.get_balance.return_value = CryptoAmount(Decimal('100.00'), CryptoType.USDT)
-    mock.process_transaction.return_value = (True, None)
-    mock.get_transaction_history.return_value = []
-    return mock
+class FakeWalletService:
+    """
+    Lightweight wallet service stand-in for tests that only need canned replies.
+    
+    Calls are recorded as ``(method, kwargs)`` tuples in ``calls``; tests that
+    need ``assert_called_once_with`` should use an ``AsyncMock`` instead.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget recorded calls and restore the canned replies."""
+        self.calls = []
+        self.balance = CryptoAmount(D100, CryptoType.USDT)
+        self.process_result = (True, None)
+    
+    async def get_balance(self, user_id, currency=None):
+        self.calls.append(("get_balance", {"user_id": user_id, "currency": currency}))
+        return self.balance
+    
+    async def process_transaction(self, transaction):
+        self.calls.append(("process_transaction", {"transaction": transaction}))
+        return self.process_result
+    
+    async def fail_transaction(self, transaction, error):
+        self.calls.append(("fail_transaction", {"transaction": transaction, "error": error}))
+    
+    async def get_transaction_history(self, user_id, limit=None):
+        self.calls.append(("get_transaction_history", {"user_id": user_id, "limit": limit}))
+        return []
 
-@pytest_asyncio.fixture
-async def mock_user_service():
-    """Create a mock user service."""
-    mock = AsyncMock()
-    mock.is_registered.return_value = True
-    mock.register_user.return_value = True
-    mock.update_last_active.return_value = None
-    return mock
+class FakeUserService:
+    """
+    Lightweight user service stand-in; every user is registered unless
+    ``registered`` is set to False.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget recorded calls and mark every user registered again."""
+        self.calls = []
+        self.registered = True
+    
+    async def is_registered(self, user_id):
+        self.calls.append(("is_registered", {"user_id": user_id}))
+        return self.registered
+    
+    async def register_user(self, user_id, username=None):
+        self.calls.append(("register_user", {"user_id": user_id, "username": username}))
+        return True
+    
+    async def update_last_active(self, user_id):
+        self.calls.append(("update_last_active", {"user_id": user_id}))
+        return True
 
-@pytest_asyncio.fixture
-async def mock_game_manager():
+# The fakes are shared per session; modules that use them opt into
+# reset_fake_services so one test's canned replies never leak into the next
+@pytest.fixture(scope="session")
+def mock_wallet_service() -> FakeWalletService:
+    """Create a fake wallet service."""
+    return FakeWalletService()
+
+@pytest.fixture(scope="session")
+def mock_user_service() -> FakeUserService:
+    """Create a fake user service."""
+    return FakeUserService()
+
+@pytest.fixture
+def reset_fake_services(
+    mock_wallet_service: FakeWalletService,
+    mock_user_service: FakeUserService
+):
+    """Restore the shared fake services after each test."""
+    yield
+    mock_wallet_service.reset()
+    mock_user_service.reset()
+
+@pytest.fixture
+def mock_game_manager() -> MagicMock:
     """Create a mock game manager."""
-    mock = AsyncMock()
-    mock.get_game.return_value = AsyncMock()
-    mock.get_game_rules.return_value = "Game rules"
+    mock = MagicMock(spec=GameManager)
+    mock.get_game_instance.return_value = AsyncMock()
     return mock
 
 @pytest_asyncio.fixture
@@ -97,39 +174,126 @@ def mock_telegram_context():
     """Create a mock telegram context."""
     return MagicMock()
 
+# CryptoAmount is frozen, so one instance per session can be shared safely
+@pytest.fixture(scope="session")
+def usdt_10() -> CryptoAmount:
+    """10 USDT."""
+    return CryptoAmount(D10, CryptoType.USDT)
+
+@pytest.fixture(scope="session")
+def usdt_20() -> CryptoAmount:
+    """20 USDT."""
+    return CryptoAmount(D20, CryptoType.USDT)
+
+@pytest.fixture(scope="session")
+def usdt_50() -> CryptoAmount:
+    """50 USDT."""
+    return CryptoAmount(D50, CryptoType.USDT)
+
 @pytest.fixture
 def mock_transaction():
     """Create a mock transaction."""
-    return Transaction.create(
+    return Transaction(
         user_id=123456789,
         type=TransactionType.DEPOSIT,
-        amount=CryptoAmount(Decimal('100.00'), CryptoType.USDT),
-        metadata={'payment_intent_id': 'test_intent_id'}
-    ) 
+        amount_minor=to_minor_units(D100, CryptoType.USDT.name),
+        currency=CryptoType.USDT.name
+    )
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session event loop its fixtures already use."""
+    # asyncio_default_fixture_loop_scope puts async fixtures on the session loop;
+    # tests need the matching marker or they would await aiosqlite on another loop
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 @pytest.fixture(scope="session")
-def engine():
-    """Create a test database engine."""
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(engine)
-    return engine
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop's policy for the session loop where it is available."""
+    # uvloop (installed everywhere but Windows) has cheaper task dispatch than the
+    # default selector loop; fall back to the default where it is unavailable
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
-@pytest.fixture(scope="session")
-def session_factory(engine):
-    """Create a test session factory."""
-    return sessionmaker(bind=engine)
+def _schema_fingerprint() -> str:
+    """Hash the DDL of every table and index so schema changes rebuild the test database."""
+    dialect = sqlite.dialect()
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda i: i.name)
+        )
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
 
-@pytest.fixture(autouse=True)
-def cleanup_database(session_factory):
-    """Clean up database after each test."""
-    yield
-    with session_factory() as session:
-        for table in reversed(Base.metadata.sorted_tables):
-            session.execute(table.delete()) 
\ No newline at end of file
+@pytest_asyncio.fixture(scope="session")
+async def engine(request):
+    """
+    Create a test database engine.
+    
+    The database is a per-worker SQLite file under .pytest_cache, so reruns
+    skip the DDL unless the schema has changed since the file was built. With
+    the cache plugin disabled (-p no:cacheprovider) it falls back to :memory:.
+    """
+    cache = getattr(request.config, "cache", None)
+    fingerprint = _schema_fingerprint()
+    if cache is None:
+        url, needs_schema = 'sqlite+aiosqlite:///:memory:', True
+    else:
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        cache_key = f"casino/schema/{worker}"
+        db_path = cache.mkdir("casino_test_db") / f"{worker}.sqlite"
+        needs_schema = not db_path.exists() or cache.get(cache_key, None) != fingerprint
+        if needs_schema and db_path.exists():
+            db_path.unlink()
+        url = f'sqlite+aiosqlite:///{db_path}'
+    
+    # StaticPool keeps every session on the one connection the outer transaction uses
+    engine = create_async_engine(url, poolclass=StaticPool)
+    
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work under the sqlite3 driver
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_conn, _connection_record):
+        dbapi_conn.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    if needs_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        if cache is not None:
+            cache.set(cache_key, fingerprint)
+    yield engine
+    await engine.dispose()
+
+@pytest_asyncio.fixture
+async def session_factory(engine):
+    """
+    Create a test session factory whose work is rolled back after the test.
+    
+    Sessions join an outer transaction on a single connection; their commits
+    only release SAVEPOINTs, so one rollback at teardown undoes everything.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        await transaction.rollback()
+
+@pytest_asyncio.fixture
+async def user_id(session_factory: async_sessionmaker) -> int:
+    """Insert a user and return its database ID."""
+    async with session_factory() as session:
+        user = User(telegram_id=123456789, username="test_user")
+        session.add(user)
+        await session.commit()
+        return user.id
@@ -0,0 +1,46 @@
+"""Unit tests for crypto amount conversions."""
+import pytest
+from decimal import Decimal
+from src.wallet.crypto_types import MINOR_UNIT_PLACES, to_minor_units, from_minor_units
+
+@pytest.mark.parametrize(
+    "amount,currency,units",
+    [
+        (Decimal('12.34'), "USD", 1234),
+        (Decimal('0.00000001'), "BTC", 1),
+        (Decimal('1.5'), "ETH", 1_500_000_000),
+        (Decimal('100.000001'), "USDT", 100_000_001),
+        (Decimal('-2.5'), "USDC", -2_500_000),
+    ]
+)
+def test_minor_units_round_trip(amount: Decimal, currency: str, units: int):
+    """Test that amounts survive the trip to minor units and back."""
+    assert to_minor_units(amount, currency) == units
+    assert from_minor_units(units, currency) == amount
+
+@pytest.mark.parametrize("currency", sorted(MINOR_UNIT_PLACES))
+def test_zero_is_normalized(currency: str):
+    """Test that zero converts back without a trailing exponent (e.g. 0E-9)."""
+    zero = from_minor_units(0, currency)
+    assert zero == 0
+    assert str(zero) == "0"
+
+@pytest.mark.parametrize(
+    "amount,currency",
+    [
+        (Decimal('0.001'), "USD"),
+        (Decimal('0.000000001'), "BTC"),
+        (Decimal('0.0000000001'), "ETH"),
+        (Decimal('1.0000001'), "USDT"),
+    ]
+)
+def test_to_minor_units_rejects_excess_precision(amount: Decimal, currency: str):
+    """Test that amounts finer than the currency's minor unit are rejected."""
+    with pytest.raises(ValueError, match="more precise"):
+        to_minor_units(amount, currency)
+
+@pytest.mark.parametrize("convert,value", [(to_minor_units, Decimal('1')), (from_minor_units, 1)])
+def test_unknown_currency(convert, value):
+    """Test that both conversions reject unknown currencies with ValueError."""
+    with pytest.raises(ValueError, match="Unsupported currency"):
+        convert(value, "DOGE")
@@ -1,140 +1,99 @@
 """Unit tests for the game handler."""
 import pytest
-from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from src.handlers.game_handler import GameHandler
 from src.wallet.crypto_types import CryptoType, CryptoAmount
 from src.games.game_base import GameResult
 
-@pytest.mark.asyncio
-async def test_games_command_registered_user(
-    mock_telegram_update,
-    mock_telegram_context,
-    mock_wallet_service,
-    mock_user_service,
-    mock_game_manager
-):
-    """Test games command with registered user."""
-    handler = GameHandler(mock_wallet_service, mock_user_service)
-    mock_user_service.is_registered.return_value = True
-    
-    await handler.games_command(mock_telegram_update, mock_telegram_context)
-    
-    mock_telegram_update.message.reply_text.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_games_command_unregistered_user(
-    mock_telegram_update,
-    mock_telegram_context,
-    mock_wallet_service,
-    mock_user_service,
-    mock_game_manager
-):
-    """Test games command with unregistered user."""
-    handler = GameHandler(mock_wallet_service, mock_user_service)
-    mock_user_service.is_registered.return_value = False
-    
-    await handler.games_command(mock_telegram_update, mock_telegram_context)
-    
-    mock_telegram_update.message.reply_text.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_show_game_menu(
-    mock_telegram_update,
-    mock_telegram_context,
-    mock_wallet_service,
-    mock_user_service,
-    mock_game_manager
-):
-    """Test showing game menu."""
-    handler = GameHandler(mock_wallet_service, mock_user_service)
-    game_type = "slots"
-    mock_game_manager.get_game.return_value = AsyncMock()
-    
-    await handler.show_game_menu(
-        mock_telegram_update,
-        mock_telegram_context,
-        game_type
-    )
-    
-    mock_telegram_update.message.reply_text.assert_called_once()
+pytestmark = pytest.mark.usefixtures("reset_fake_services")
 
-@pytest.mark.asyncio
-async def test_show_game_rules(
-    mock_telegram_update,
-    mock_telegram_context,
-    mock_wallet_service,
-    mock_user_service,
-    mock_game_manager
-):
-    """Test showing game rules."""
-    handler = GameHandler(mock_wallet_service, mock_user_service)
-    game_type = "slots"
-    mock_game_manager.get_game.return_value = AsyncMock()
-    mock_game_manager.get_game_rules.return_value = "Game rules"
-    
-    await handler.show_game_rules(
-        mock_telegram_update,
-        mock_telegram_context,
-        game_type
-    )
-    
-    mock_telegram_update.message.reply_text.assert_called_once()
+@pytest.fixture(scope="session")
+def handler(mock_wallet_service, mock_user_service) -> GameHandler:
+    """Create a game handler wired to the mock services."""
+    return GameHandler(mock_wallet_service, mock_user_service)
 
-@pytest.mark.asyncio
-async def test_handle_bet_amount_valid(
-    mock_telegram_update,
-    mock_telegram_context,
-    mock_wallet_service,
-    mock_user_service,
-    mock_game_manager
-):
-    """Test handling valid bet amount."""
-    handler = GameHandler(mock_wallet_service, mock_user_service)
-    game_type = "slots"
-    crypto_type = CryptoType.USDT
-    mock_telegram_update.message.text = "10.00"
-    
-    # Mock game result
-    mock_game = AsyncMock()
-    mock_game.play.return_value = GameResult(
+@pytest.fixture(scope="module")
+def winning_result(usdt_10: CryptoAmount, usdt_20: CryptoAmount) -> GameResult:
+    """A winning slots round: bet 10 USDT, win 20 USDT."""
+    return GameResult(
         player_id=123456789,
-        game_type=game_type,
-        bet_amount=CryptoAmount(Decimal('10.00'), crypto_type),
-        win_amount=CryptoAmount(Decimal('20.00'), crypto_type),
+        game_type="slots",
+        bet_amount=usdt_10,
+        win_amount=usdt_20,
         outcome="You won!",
         game_data={'grid': [['🍎', '🍎', '🍎']]}
     )
-    mock_game_manager.get_game.return_value = mock_game
-    
-    await handler.handle_bet_amount(
-        mock_telegram_update,
-        mock_telegram_context,
-        game_type,
-        crypto_type
-    )
-    
-    mock_telegram_update.message.reply_text.assert_called_once()
 
-@pytest.mark.asyncio
-async def test_handle_bet_amount_invalid(
+def _any_game(result: GameResult) -> AsyncMock:
+    """Create a mock game with no scripted outcome."""
+    game = AsyncMock()
+    game.get_game_rules = MagicMock(return_value="Game rules")
+    return game
+
+def _winning_game(result: GameResult) -> AsyncMock:
+    """Create a mock game whose next round returns ``result``."""
+    game = AsyncMock()
+    game.play.return_value = result
+    return game
+
+@pytest.mark.parametrize(
+    "method_name,extra_args,registered,message_text,make_game",
+    [
+        pytest.param(
+            "games_command", (), True, None, None,
+            id="games_command_registered_user"
+        ),
+        pytest.param(
+            "games_command", (), False, None, None,
+            id="games_command_unregistered_user"
+        ),
+        pytest.param(
+            "show_game_menu", ("slots",), True, None, _any_game,
+            id="show_game_menu"
+        ),
+        pytest.param(
+            "show_game_rules", ("slots",), True, None, _any_game,
+            id="show_game_rules"
+        ),
+        pytest.param(
+            "handle_bet_amount", ("slots", CryptoType.USDT), True, "10.00", _winning_game,
+            id="handle_bet_amount_valid"
+        ),
+        pytest.param(
+            "handle_bet_amount", ("slots", CryptoType.USDT), True, "invalid", None,
+            id="handle_bet_amount_invalid"
+        ),
+    ]
+)
+async def test_game_handler_dispatch(
+    handler,
     mock_telegram_update,
     mock_telegram_context,
-    mock_wallet_service,
     mock_user_service,
-    mock_game_manager
+    winning_result,
+    request,
+    monkeypatch,
+    method_name,
+    extra_args,
+    registered,
+    message_text,
+    make_game
 ):
-    """Test handling invalid bet amount."""
-    handler = GameHandler(mock_wallet_service, mock_user_service)
-    game_type = "slots"
-    crypto_type = CryptoType.USDT
-    mock_telegram_update.message.text = "invalid"
+    """Test that each game handler entry point replies exactly once."""
+    mock_user_service.registered = registered
+    if message_text is not None:
+        mock_telegram_update.message.text = message_text
+    if make_game is not None:
+        # Only the cases that script a game pay for building the game manager mock
+        mock_game_manager = request.getfixturevalue("mock_game_manager")
+        mock_game_manager.get_game_instance.return_value = make_game(winning_result)
+        # GameHandler looks games up through the module-level manager
+        monkeypatch.setattr("src.handlers.game_handler.game_manager", mock_game_manager)
     
-    await handler.handle_bet_amount(
+    await getattr(handler, method_name)(
         mock_telegram_update,
         mock_telegram_context,
-        game_type,
-        crypto_type
+        *extra_args
     )
     
-    mock_telegram_update.message.reply_text.assert_called_once() 
\ No newline at end of file
+    mock_telegram_update.message.reply_text.assert_called_once()
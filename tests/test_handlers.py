@@ -11,8 +11,35 @@ from telegram.ext import ContextTypes
 from src.handlers.start_handler import StartHandler
 from src.handlers.wallet_handler import WalletHandler
 from src.handlers.help_handler import HelpHandler
+from src.wallet.transaction import TransactionType
 
-@pytest.fixture
+# Decimal is immutable, so the amounts used across tests are parsed once
+D10 = Decimal("10.00")
+D30 = Decimal("30.00")
+D50 = Decimal("50.00")
+D100 = Decimal("100.00")
+
+# The Telegram object mocks are never mutated by tests, so they are built
+# once per session. The service and context mocks are also shared, and are
+# reset to their default behaviour after every test by ``_reset_mocks``.
+
+def _prime_context(context: MagicMock) -> None:
+    """Give the context mock its default state."""
+    context.args = []
+
+def _prime_user_service(service: AsyncMock) -> None:
+    """Give the user service mock its default return values."""
+    service.is_user_registered.return_value = False
+    service.register_user.return_value = True
+    service.update_last_active.return_value = True
+
+def _prime_wallet_service(service: AsyncMock) -> None:
+    """Give the wallet service mock its default return values."""
+    service.create_transaction.return_value = True
+    service.get_user_balance.return_value = D100
+    service.get_user_transactions.return_value = []
+
+@pytest.fixture(scope="session")
 def mock_user() -> User:
     """Create a mock Telegram user."""
     user = MagicMock(spec=User)
@@ -21,14 +48,14 @@ def mock_user() -> User:
     user.username = "testuser"
     return user
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_chat() -> Chat:
     """Create a mock Telegram chat."""
     chat = MagicMock(spec=Chat)
     chat.id = 123456
     return chat
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_message(mock_user: User, mock_chat: Chat) -> Message:
     """Create a mock Telegram message."""
     message = MagicMock(spec=Message)
@@ -36,7 +63,7 @@ def mock_message(mock_user: User, mock_chat: Chat) -> Message:
     message.chat = mock_chat
     return message
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_update(mock_message: Message) -> Update:
     """Create a mock Telegram update."""
     update = MagicMock(spec=Update)
@@ -45,32 +72,42 @@ def mock_update(mock_message: Message) -> Update:
     update.message = mock_message
     return update
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_context() -> ContextTypes.DEFAULT_TYPE:
     """Create a mock context."""
     context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
     context.bot = AsyncMock()
+    _prime_context(context)
     return context
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_user_service() -> AsyncMock:
     """Create a mock user service."""
     service = AsyncMock()
-    service.is_user_registered = AsyncMock(return_value=False)
-    service.register_user = AsyncMock(return_value=True)
-    service.update_last_active = AsyncMock(return_value=True)
+    _prime_user_service(service)
     return service
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_wallet_service() -> AsyncMock:
     """Create a mock wallet service."""
     service = AsyncMock()
-    service.create_transaction = AsyncMock(return_value=True)
-    service.get_user_balance = AsyncMock(return_value=Decimal("100.00"))
-    service.get_user_transactions = AsyncMock(return_value=[])
+    _prime_wallet_service(service)
     return service
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    mock_context: ContextTypes.DEFAULT_TYPE,
+    mock_user_service: AsyncMock,
+    mock_wallet_service: AsyncMock
+) -> Generator[None, None, None]:
+    """Clear recorded calls and restore default behaviour after each test."""
+    yield
+    for mock in (mock_context, mock_user_service, mock_wallet_service):
+        mock.reset_mock(return_value=True, side_effect=True)
+    _prime_context(mock_context)
+    _prime_user_service(mock_user_service)
+    _prime_wallet_service(mock_wallet_service)
+
 async def test_start_handler_new_user(
     mock_update: Update,
     mock_context: ContextTypes.DEFAULT_TYPE,
@@ -89,8 +126,8 @@ async def test_start_handler_new_user(
     # Verify welcome bonus transaction
     mock_wallet_service.create_transaction.assert_called_once_with(
         user_id=123456,
-        type="bonus",
-        amount=Decimal("10.00"),
+        type=TransactionType.BONUS,
+        amount=D10,
         currency="USD"
     )
     
@@ -100,7 +137,6 @@ async def test_start_handler_new_user(
     assert "Welcome to the Casino Bot" in args["text"]
     assert "$10.00 welcome bonus" in args["text"]
 
-@pytest.mark.asyncio
 async def test_start_handler_existing_user(
     mock_update: Update,
     mock_context: ContextTypes.DEFAULT_TYPE,
@@ -127,7 +163,6 @@ async def test_start_handler_existing_user(
     assert "Welcome back" in args["text"]
     assert "$100.00" in args["text"]
 
-@pytest.mark.asyncio
 async def test_help_handler(
     mock_update: Update,
     mock_context: ContextTypes.DEFAULT_TYPE
@@ -147,92 +182,54 @@ async def test_help_handler(
     assert "/withdraw" in args["text"]
     assert "/balance" in args["text"]
 
-@pytest.mark.asyncio
-async def test_wallet_handler_deposit(
+@pytest.mark.parametrize(
+    "method,args,expected_type,amount,balance_reads,reply_fragment",
+    [
+        ("handle_deposit", ["50.00"], TransactionType.DEPOSIT, D50, 1, "Deposited: $50.00"),
+        ("handle_withdraw", ["30.00"], TransactionType.WITHDRAWAL, D30, 2, "Withdrawn: $30.00"),
+        ("handle_balance", [], None, None, 1, "Current balance: $100.00"),
+    ],
+    ids=["deposit", "withdraw", "balance"]
+)
+async def test_wallet_handler(
     mock_update: Update,
     mock_context: ContextTypes.DEFAULT_TYPE,
     mock_user_service: AsyncMock,
-    mock_wallet_service: AsyncMock
+    mock_wallet_service: AsyncMock,
+    method: str,
+    args: list,
+    expected_type: TransactionType,
+    amount: Decimal,
+    balance_reads: int,
+    reply_fragment: str
 ):
-    """Test wallet handler deposit command."""
+    """Test wallet handler deposit, withdraw and balance commands."""
     mock_user_service.is_user_registered.return_value = True
     handler = WalletHandler(mock_user_service, mock_wallet_service)
     
-    # Set up deposit amount in context
-    mock_context.args = ["50.00"]
+    # Set up command arguments in context
+    mock_context.args = args
     
-    await handler.handle_deposit(mock_update, mock_context)
+    await getattr(handler, method)(mock_update, mock_context)
     
-    # Verify transaction creation
-    mock_wallet_service.create_transaction.assert_called_once_with(
-        user_id=123456,
-        type="deposit",
-        amount=Decimal("50.00"),
-        currency="USD"
-    )
+    if expected_type is None:
+        # Verify transaction history check
+        mock_wallet_service.get_user_transactions.assert_called_once_with(123456, limit=5)
+    else:
+        # Verify transaction creation
+        mock_wallet_service.create_transaction.assert_called_once_with(
+            user_id=123456,
+            type=expected_type,
+            amount=amount,
+            currency="USD"
+        )
     
-    # Verify balance check
-    mock_wallet_service.get_user_balance.assert_called_once_with(123456, "USD")
+    # Verify balance check (withdrawals also read it before debiting)
+    mock_wallet_service.get_user_balance.assert_called_with(123456, "USD")
+    assert mock_wallet_service.get_user_balance.call_count == balance_reads
     
-    # Verify success message
+    # Verify reply message
     mock_context.bot.send_message.assert_called_once()
-    args = mock_context.bot.send_message.call_args[1]
-    assert "Deposited: $50.00" in args["text"]
-    assert "Current balance: $100.00" in args["text"]
-
-@pytest.mark.asyncio
-async def test_wallet_handler_withdraw(
-    mock_update: Update,
-    mock_context: ContextTypes.DEFAULT_TYPE,
-    mock_user_service: AsyncMock,
-    mock_wallet_service: AsyncMock
-):
-    """Test wallet handler withdraw command."""
-    mock_user_service.is_user_registered.return_value = True
-    handler = WalletHandler(mock_user_service, mock_wallet_service)
-    
-    # Set up withdrawal amount in context
-    mock_context.args = ["30.00"]
-    
-    await handler.handle_withdraw(mock_update, mock_context)
-    
-    # Verify transaction creation
-    mock_wallet_service.create_transaction.assert_called_once_with(
-        user_id=123456,
-        type="withdraw",
-        amount=Decimal("30.00"),
-        currency="USD"
-    )
-    
-    # Verify balance check
-    mock_wallet_service.get_user_balance.assert_called()
-    
-    # Verify success message
-    mock_context.bot.send_message.assert_called_once()
-    args = mock_context.bot.send_message.call_args[1]
-    assert "Withdrawn: $30.00" in args["text"]
-    assert "Current balance: $100.00" in args["text"]
-
-@pytest.mark.asyncio
-async def test_wallet_handler_balance(
-    mock_update: Update,
-    mock_context: ContextTypes.DEFAULT_TYPE,
-    mock_user_service: AsyncMock,
-    mock_wallet_service: AsyncMock
-):
-    """Test wallet handler balance command."""
-    mock_user_service.is_user_registered.return_value = True
-    handler = WalletHandler(mock_user_service, mock_wallet_service)
-    
-    await handler.handle_balance(mock_update, mock_context)
-    
-    # Verify balance check
-    mock_wallet_service.get_user_balance.assert_called_once_with(123456, "USD")
-    
-    # Verify transaction history check
-    mock_wallet_service.get_user_transactions.assert_called_once_with(123456)
-    
-    # Verify balance message
-    mock_context.bot.send_message.assert_called_once()
-    args = mock_context.bot.send_message.call_args[1]
-    assert "Current balance: $100.00" in args["text"] 
\ No newline at end of file
+    text = mock_context.bot.send_message.call_args[1]["text"]
+    assert reply_fragment in text
+    assert "Current balance: $100.00" in text
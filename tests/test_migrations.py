@@ -0,0 +1,86 @@
+"""Tests for the Alembic migrations."""
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.wallet.transaction import TransactionType
+from src.wallet.wallet_service import WalletService
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[1] / "migrations"
+
+# (type, amount, currency) rows in the pre-0002 string/Numeric format
+OLD_ROWS = [
+    ("deposit", "12.34", "USD", TransactionType.DEPOSIT, 1234),
+    ("withdraw", "0.50", "BTC", TransactionType.WITHDRAWAL, 50_000_000),
+    ("win", "7.25", "USDT", TransactionType.WIN, 7_250_000),
+]
+
+def _run(connection, revision: str, downgrade: bool = False) -> None:
+    """Run an Alembic upgrade/downgrade on the caller's connection."""
+    # No ini file, so env.py leaves the test logging configuration alone
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+    (command.downgrade if downgrade else command.upgrade)(config, revision)
+
+@pytest.fixture
+async def migration_engine(tmp_path: Path):
+    """Create an engine on an empty SQLite file for the migrations to build."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    await engine.dispose()
+
+async def test_upgrade_converts_transactions(migration_engine):
+    """Test that 0002 converts old rows and that downgrading restores them."""
+    async with migration_engine.begin() as conn:
+        await conn.run_sync(_run, "0001")
+        await conn.execute(
+            text("INSERT INTO users (id, telegram_id, username) VALUES (1, 123456789, 'test_user')")
+        )
+        for tx_type, amount, currency, _, _ in OLD_ROWS:
+            await conn.execute(
+                text(
+                    "INSERT INTO transactions (user_id, type, amount, currency, status) "
+                    "VALUES (1, :type, :amount, :currency, 'completed')"
+                ),
+                {"type": tx_type, "amount": amount, "currency": currency}
+            )
+        await conn.run_sync(_run, "head")
+    
+    # The upgraded rows must read back through the current models
+    wallet_service = WalletService(async_sessionmaker(migration_engine, expire_on_commit=False))
+    history = await wallet_service.get_user_transactions(1)
+    assert [(tx.type, tx.amount_minor) for tx in reversed(history)] == [
+        (tx_type, minor) for _, _, _, tx_type, minor in OLD_ROWS
+    ]
+    assert await wallet_service.get_user_balance(1, "USD") == Decimal('12.34')
+    
+    async with migration_engine.begin() as conn:
+        await conn.run_sync(_run, "0001", True)
+        rows = (await conn.execute(
+            text("SELECT type, amount, currency FROM transactions ORDER BY id")
+        )).all()
+    assert [(t, Decimal(str(a)), c) for t, a, c in rows] == [
+        (tx_type, Decimal(amount), currency) for tx_type, amount, currency, _, _ in OLD_ROWS
+    ]
+
+async def test_upgrade_rejects_unknown_type(migration_engine):
+    """Test that 0002 refuses to run rather than dropping unmapped rows."""
+    async with migration_engine.begin() as conn:
+        await conn.run_sync(_run, "0001")
+        await conn.execute(
+            text("INSERT INTO users (id, telegram_id, username) VALUES (1, 123456789, 'test_user')")
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO transactions (user_id, type, amount, currency, status) "
+                "VALUES (1, 'jackpot', 1, 'USD', 'completed')"
+            )
+        )
+        with pytest.raises(RuntimeError):
+            await conn.run_sync(_run, "head")
@@ -0,0 +1,52 @@
+"""Unit tests for the payment service."""
+import pytest
+from decimal import Decimal
+from typing import List
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.payments.service import PaymentService
+from src.wallet.transaction import Transaction, TransactionType
+from src.wallet.wallet_service import WalletService, PENDING_BATCH_SIZE
+
+@pytest.mark.parametrize(
+    "pending_count",
+    [2 * PENDING_BATCH_SIZE + 7, 2 * PENDING_BATCH_SIZE],
+    ids=["partial_last_page", "exact_pages"]
+)
+async def test_check_pending_payments_processes_each_once(
+    session_factory: async_sessionmaker,
+    user_id: int,
+    monkeypatch: pytest.MonkeyPatch,
+    pending_count: int
+):
+    """Test that paging visits every pending transaction exactly once, in ID order."""
+    wallet_service = WalletService(session_factory)
+    rows = []
+    for i in range(pending_count):
+        statuses = ["pending"] if i % 10 else ["completed", "pending"]
+        # Settled rows are interleaved and must be skipped
+        rows.extend(
+            {
+                "user_id": user_id,
+                "type": TransactionType.DEPOSIT,
+                "amount": Decimal('1.00'),
+                "currency": "USD",
+                "status": s
+            }
+            for s in statuses
+        )
+    ids = await wallet_service.create_transactions_bulk(rows)
+    pending_ids = [tx_id for tx_id, row in zip(ids, rows) if row["status"] == "pending"]
+    assert len(pending_ids) == pending_count
+    
+    service = PaymentService(wallet_service)
+    batches: List[List[int]] = []
+    async def _record_batch(pending_transactions: List[Transaction]) -> None:
+        batches.append([tx.id for tx in pending_transactions])
+    monkeypatch.setattr(service, "_process_pending_batch", _record_batch)
+    
+    await service.check_pending_payments()
+    
+    processed = [tx_id for batch in batches for tx_id in batch]
+    assert processed == pending_ids
+    assert all(len(batch) <= PENDING_BATCH_SIZE for batch in batches)
+    assert len(batches) == -(-pending_count // PENDING_BATCH_SIZE)
@@ -1,41 +1,36 @@
 import pytest
-import asyncio
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine, Engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from pytest import FixtureRequest
 from _pytest.fixtures import FixtureFunction
 
-from src.user_service import UserService, User, Base
+from src.user_service import UserService, User
 
-@pytest.fixture
-def engine() -> Engine:
-    """Create a test database engine."""
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(engine)
-    return engine
+# The schema is created once by the session-scoped ``engine`` fixture in
+# conftest.py; ``session_factory`` rolls each test's writes back. Tests that
+# need a broken database live in test_user_service_errors.py.
 
-@pytest.fixture
-def session_factory(engine: Engine) -> sessionmaker:
-    """Create a test session factory."""
-    factory = sessionmaker()
-    factory.configure(bind=engine)
-    return factory
+def _clock_at(instant: datetime) -> type:
+    """Build a ``datetime`` stand-in whose ``now()`` always returns ``instant``."""
+    class _FixedClock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return instant
+    return _FixedClock
 
 @pytest.fixture
-def user_service(session_factory: sessionmaker) -> UserService:
+def user_service(session_factory: async_sessionmaker) -> UserService:
     """Create a test user service."""
     return UserService(session_factory)
 
-@pytest.mark.asyncio
 async def test_register_user(user_service: UserService):
     """Test registering a new user."""
     # Register a new user
-    success = await user_service.register_user(telegram_id=123456)
+    success = await user_service.register_user(telegram_id=123456, username="test_user")
     assert success is True
     
     # Try to register the same user again
-    success = await user_service.register_user(telegram_id=123456)
+    success = await user_service.register_user(telegram_id=123456, username="test_user")
     assert success is True  # Should return True for already registered users
     
     # Verify user exists
@@ -43,7 +38,6 @@ async def test_register_user(user_service: UserService):
     assert user is not None
     assert user.telegram_id == 123456
 
-@pytest.mark.asyncio
 async def test_is_user_registered(user_service: UserService):
     """Test checking if a user is registered."""
     # Check unregistered user
@@ -51,24 +45,26 @@ async def test_is_user_registered(user_service: UserService):
     assert is_registered is False
     
     # Register user
-    await user_service.register_user(telegram_id=123456)
+    await user_service.register_user(telegram_id=123456, username="test_user")
     
     # Check registered user
     is_registered = await user_service.is_user_registered(telegram_id=123456)
     assert is_registered is True
 
-@pytest.mark.asyncio
-async def test_update_last_active(user_service: UserService):
+async def test_update_last_active(user_service: UserService, monkeypatch: pytest.MonkeyPatch):
     """Test updating user's last active timestamp."""
     # Register user
-    await user_service.register_user(telegram_id=123456)
+    await user_service.register_user(telegram_id=123456, username="test_user")
     
     # Get initial last active time
     user = await user_service.get_user(telegram_id=123456)
     initial_last_active = user.last_active
     
-    # Wait a moment
-    await asyncio.sleep(0.1)
+    # Advance the service's clock instead of sleeping
+    monkeypatch.setattr(
+        "src.user_service.datetime",
+        _clock_at(initial_last_active + timedelta(seconds=1))
+    )
     
     # Update last active
     success = await user_service.update_last_active(telegram_id=123456)
@@ -78,7 +74,6 @@ async def test_update_last_active(user_service: UserService):
     user = await user_service.get_user(telegram_id=123456)
     assert user.last_active > initial_last_active
 
-@pytest.mark.asyncio
 async def test_get_user(user_service: UserService):
     """Test getting a user by Telegram ID."""
     # Try to get non-existent user
@@ -86,28 +81,26 @@ async def test_get_user(user_service: UserService):
     assert user is None
     
     # Register user
-    await user_service.register_user(telegram_id=123456)
+    await user_service.register_user(telegram_id=123456, username="test_user")
     
     # Get existing user
     user = await user_service.get_user(telegram_id=123456)
     assert user is not None
     assert user.telegram_id == 123456
 
-@pytest.mark.asyncio
-async def test_error_handling(user_service: UserService, session_factory: sessionmaker):
-    """Test error handling in user service."""
-    # Close the engine to simulate database errors
-    session_factory.kw['bind'].dispose()
+async def test_user_cache(user_service: UserService):
+    """Test that lookups are cached and last_active writes are debounced."""
+    await user_service.register_user(telegram_id=123456, username="test_user")
     
-    # Verify operations fail gracefully
-    success = await user_service.register_user(telegram_id=123456)
-    assert success is False
-    
-    is_registered = await user_service.is_user_registered(telegram_id=123456)
-    assert is_registered is False
+    # Repeated lookups are served from the cache
+    user = await user_service.get_user(telegram_id=123456)
+    assert await user_service.get_user(telegram_id=123456) is user
     
-    success = await user_service.update_last_active(telegram_id=123456)
-    assert success is False
+    # The first update writes and invalidates the cached user
+    assert await user_service.update_last_active(telegram_id=123456) is True
+    assert await user_service.get_user(telegram_id=123456) is not user
     
+    # A second update inside the debounce window is skipped
     user = await user_service.get_user(telegram_id=123456)
-    assert user is None 
\ No newline at end of file
+    assert await user_service.update_last_active(telegram_id=123456) is True
+    assert await user_service.get_user(telegram_id=123456) is user
@@ -0,0 +1,51 @@
+import logging
+import pytest
+from typing import Any, Dict
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.user_service import UserService
+
+# Database failures are injected by making every statement the service runs
+# raise, so the schema and connection stay intact for the rest of the suite.
+
+def _raise_operational_error(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for ``AsyncSession.execute``/``scalar`` during a database outage."""
+    raise OperationalError("SELECT 1", {}, Exception("database is locked"))
+
+@pytest.fixture
+def failing_user_service(
+    session_factory: async_sessionmaker,
+    monkeypatch: pytest.MonkeyPatch
+) -> UserService:
+    """Create a user service whose every database statement fails."""
+    monkeypatch.setattr(AsyncSession, "execute", _raise_operational_error)
+    monkeypatch.setattr(AsyncSession, "scalar", _raise_operational_error)
+    return UserService(session_factory)
+
+@pytest.mark.parametrize(
+    "method,kwargs,expected",
+    [
+        ("register_user", {"telegram_id": 123456, "username": "test_user"}, False),
+        ("is_user_registered", {"telegram_id": 123456}, False),
+        ("update_last_active", {"telegram_id": 123456}, False),
+        ("get_user", {"telegram_id": 123456}, None),
+    ]
+)
+async def test_error_handling(
+    failing_user_service: UserService,
+    caplog: pytest.LogCaptureFixture,
+    method: str,
+    kwargs: Dict[str, Any],
+    expected: Any
+):
+    """Test that each user service operation fails gracefully on database errors."""
+    with caplog.at_level(logging.ERROR, logger="src.user_service"):
+        result = await getattr(failing_user_service, method)(**kwargs)
+
+    # Verify the documented fallback value is returned and the failure is logged
+    assert result is expected
+    assert any(
+        record.levelno == logging.ERROR and "database is locked" in record.getMessage()
+        for record in caplog.records
+    )
@@ -1,10 +1,46 @@
 """Unit tests for the wallet service."""
 import pytest
 from decimal import Decimal
-from src.wallet.crypto_types import CryptoType, CryptoAmount
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.wallet.crypto_types import CryptoType, CryptoAmount, to_minor_units
 from src.wallet.transaction import Transaction, TransactionType
+from src.wallet.wallet_service import WalletService
+
+D100 = Decimal('100.00')
+
+pytestmark = pytest.mark.usefixtures("reset_fake_services")
+
+@pytest.fixture(scope="module")
+def withdrawal_tx(usdt_50: CryptoAmount) -> Transaction:
+    """A 50 USDT withdrawal."""
+    return Transaction(
+        user_id=123456789,
+        type=TransactionType.WITHDRAWAL,
+        amount_minor=to_minor_units(usdt_50.amount, usdt_50.currency.name),
+        currency=usdt_50.currency.name
+    )
+
+@pytest.fixture(scope="module")
+def bet_tx(usdt_10: CryptoAmount) -> Transaction:
+    """A 10 USDT slots bet."""
+    return Transaction(
+        user_id=123456789,
+        type=TransactionType.BET,
+        amount_minor=to_minor_units(usdt_10.amount, usdt_10.currency.name),
+        currency=usdt_10.currency.name
+    )
+
+@pytest.fixture(scope="module")
+def win_tx(usdt_20: CryptoAmount) -> Transaction:
+    """A 20 USDT slots win."""
+    return Transaction(
+        user_id=123456789,
+        type=TransactionType.WIN,
+        amount_minor=to_minor_units(usdt_20.amount, usdt_20.currency.name),
+        currency=usdt_20.currency.name
+    )
 
-@pytest.mark.asyncio
 async def test_get_balance(mock_wallet_service):
     """Test getting user balance."""
     user_id = 123456789
@@ -13,10 +49,9 @@ async def test_get_balance(mock_wallet_service):
     balance = await mock_wallet_service.get_balance(user_id, crypto_type)
     
     assert isinstance(balance, CryptoAmount)
-    assert balance.amount == Decimal('100.00')
+    assert balance.amount == D100
     assert balance.currency == CryptoType.USDT
 
-@pytest.mark.asyncio
 async def test_process_deposit_transaction(mock_wallet_service, mock_transaction):
     """Test processing a deposit transaction."""
     success, error = await mock_wallet_service.process_transaction(mock_transaction)
@@ -24,54 +59,29 @@ async def test_process_deposit_transaction(mock_wallet_service, mock_transaction
     assert success is True
     assert error is None
 
-@pytest.mark.asyncio
-async def test_process_withdrawal_transaction(mock_wallet_service):
+async def test_process_withdrawal_transaction(mock_wallet_service, withdrawal_tx):
     """Test processing a withdrawal transaction."""
-    transaction = Transaction.create(
-        user_id=123456789,
-        type=TransactionType.WITHDRAWAL,
-        amount=CryptoAmount(Decimal('50.00'), CryptoType.USDT),
-        metadata={'address': 'test_address'}
-    )
+    mock_wallet_service.process_result = (False, "Insufficient funds")
     
-    mock_wallet_service.process_transaction.return_value = (False, "Insufficient funds")
-    
-    success, error = await mock_wallet_service.process_transaction(transaction)
+    success, error = await mock_wallet_service.process_transaction(withdrawal_tx)
     
     assert success is False
     assert error == "Insufficient funds"
 
-@pytest.mark.asyncio
-async def test_process_bet_transaction(mock_wallet_service):
+async def test_process_bet_transaction(mock_wallet_service, bet_tx):
     """Test processing a bet transaction."""
-    transaction = Transaction.create(
-        user_id=123456789,
-        type=TransactionType.BET,
-        amount=CryptoAmount(Decimal('10.00'), CryptoType.USDT),
-        metadata={'game_type': 'slots'}
-    )
-    
-    success, error = await mock_wallet_service.process_transaction(transaction)
+    success, error = await mock_wallet_service.process_transaction(bet_tx)
     
     assert success is True
     assert error is None
 
-@pytest.mark.asyncio
-async def test_process_win_transaction(mock_wallet_service):
+async def test_process_win_transaction(mock_wallet_service, win_tx):
     """Test processing a win transaction."""
-    transaction = Transaction.create(
-        user_id=123456789,
-        type=TransactionType.WIN,
-        amount=CryptoAmount(Decimal('20.00'), CryptoType.USDT),
-        metadata={'game_type': 'slots', 'bet_transaction_id': 'test_bet_id'}
-    )
-    
-    success, error = await mock_wallet_service.process_transaction(transaction)
+    success, error = await mock_wallet_service.process_transaction(win_tx)
     
     assert success is True
     assert error is None
 
-@pytest.mark.asyncio
 async def test_get_transaction_history(mock_wallet_service):
     """Test getting transaction history."""
     user_id = 123456789
@@ -81,11 +91,114 @@ async def test_get_transaction_history(mock_wallet_service):
     
     assert isinstance(history, list)
 
-@pytest.mark.asyncio
 async def test_fail_transaction(mock_wallet_service, mock_transaction):
     """Test failing a transaction."""
     error_message = "Test error"
     
     await mock_wallet_service.fail_transaction(mock_transaction, error_message)
     
-    assert mock_transaction.status == "FAILED" 
\ No newline at end of file
+    assert mock_transaction.status == "FAILED"
+
+# The tests below run WalletService against the real schema through
+# conftest.py's ``session_factory``, which rolls each test's writes back.
+
+@pytest.fixture
+def wallet_service(session_factory: async_sessionmaker) -> WalletService:
+    """Create a wallet service backed by the test database."""
+    return WalletService(session_factory)
+
+async def test_create_transactions_bulk_returns_ids_in_order(
+    wallet_service: WalletService,
+    session_factory: async_sessionmaker,
+    user_id: int
+):
+    """Test that bulk insert returns one ID per row, in the order of the rows."""
+    amounts = [Decimal('5.00'), Decimal('1.25'), Decimal('300.10'), Decimal('0.01')]
+    rows = [
+        {"user_id": user_id, "type": TransactionType.DEPOSIT, "amount": amount, "currency": "USD"}
+        for amount in amounts
+    ]
+    
+    ids = await wallet_service.create_transactions_bulk(rows)
+    
+    assert len(ids) == len(rows)
+    async with session_factory() as session:
+        stored = {
+            tx.id: tx.amount
+            for tx in await session.scalars(select(Transaction).where(Transaction.id.in_(ids)))
+        }
+    assert [stored[tx_id] for tx_id in ids] == amounts
+
+async def test_create_transactions_bulk_rejects_invalid_row(
+    wallet_service: WalletService,
+    session_factory: async_sessionmaker,
+    user_id: int
+):
+    """Test that one row finer than its currency's minor unit fails the whole batch."""
+    rows = [
+        {"user_id": user_id, "type": TransactionType.DEPOSIT, "amount": Decimal('1.00'), "currency": "USD"},
+        {"user_id": user_id, "type": TransactionType.DEPOSIT, "amount": Decimal('0.001'), "currency": "USD"},
+    ]
+    
+    assert await wallet_service.create_transactions_bulk(rows) == []
+    async with session_factory() as session:
+        assert (await session.scalars(select(Transaction.id))).all() == []
+
+def _usd(user_id: int, type: TransactionType, amount: str, status: str = "completed") -> dict:
+    """Build a USD transaction row for create_transactions_bulk."""
+    return {
+        "user_id": user_id,
+        "type": type,
+        "amount": Decimal(amount),
+        "currency": "USD",
+        "status": status
+    }
+
+async def test_balance_after_credit_and_debit(wallet_service: WalletService, user_id: int):
+    """Test that completed credits add, debits subtract and pending rows are ignored."""
+    await wallet_service.create_transactions_bulk([
+        _usd(user_id, TransactionType.DEPOSIT, "100.00"),
+        _usd(user_id, TransactionType.BONUS, "10.00"),
+        _usd(user_id, TransactionType.WITHDRAWAL, "30.00"),
+        _usd(user_id, TransactionType.BET, "5.50"),
+        _usd(user_id, TransactionType.WITHDRAWAL, "40.00", status="pending"),
+    ])
+    
+    assert await wallet_service.get_user_balance(user_id, "USD") == Decimal('74.50')
+    
+    # A later credit invalidates the cached balance
+    await wallet_service.create_transactions_bulk([_usd(user_id, TransactionType.WIN, "0.50")])
+    assert await wallet_service.get_user_balance(user_id, "USD") == Decimal('75.00')
+
+async def test_balance_cache_invalidated_on_status_update(wallet_service: WalletService, user_id: int):
+    """Test that completing a pending transaction drops the cached balance."""
+    deposit_id, withdrawal_id = await wallet_service.create_transactions_bulk([
+        _usd(user_id, TransactionType.DEPOSIT, "100.00"),
+        _usd(user_id, TransactionType.WITHDRAWAL, "25.00", status="pending"),
+    ])
+    
+    assert await wallet_service.get_user_balance(user_id, "USD") == D100
+    assert wallet_service._balance_cache[(user_id, "USD")] == D100
+    
+    assert await wallet_service.update_transaction_status(withdrawal_id, "completed") is True
+    assert (user_id, "USD") not in wallet_service._balance_cache
+    assert await wallet_service.get_user_balance(user_id, "USD") == Decimal('75.00')
+
+async def test_balance_not_cached_when_write_races_read(
+    wallet_service: WalletService,
+    user_id: int,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a balance read overlapping a write is returned but not cached."""
+    await wallet_service.create_transactions_bulk([_usd(user_id, TransactionType.DEPOSIT, "100.00")])
+    
+    # Land a write for the same key while the read's query is in flight
+    from src.wallet import wallet_service as wallet_module
+    convert = wallet_module.from_minor_units
+    def _convert_during_write(units, currency):
+        wallet_service._invalidate_balance(user_id, currency)
+        return convert(units, currency)
+    monkeypatch.setattr(wallet_module, "from_minor_units", _convert_during_write)
+    
+    assert await wallet_service.get_user_balance(user_id, "USD") == D100
+    assert (user_id, "USD") not in wallet_service._balance_cache